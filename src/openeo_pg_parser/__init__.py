@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
-from pkg_resources import get_distribution, DistributionNotFound
 
-try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = __name__
-    __version__ = get_distribution(dist_name).version
-except DistributionNotFound:
-    __version__ = 'unknown'
-finally:
-    del get_distribution, DistributionNotFound
+
+def __getattr__(name):
+    """ Determines the package version only when it is requested, since reading distribution metadata is slow. """
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            # Change here if project is renamed and does not equal the package name
+            dist_name = __name__
+            return version(dist_name)
+        except PackageNotFoundError:
+            return 'unknown'
+
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -0,0 +1,145 @@
+import os
+import time
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Size-bounded cache with least-recently-used eviction, an optional time-to-live of its entries and an optional
+    on-disk storage shared between processes.
+    """
+
+    def __init__(self, maxsize=128, ttl=None, dirpath=None):
+        """
+        Constructor of `LRUCache` class.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries kept in memory (default is 128).
+        ttl : float, optional
+            Time-to-live of an entry in seconds. If None, entries do not expire.
+        dirpath : str, optional
+            Directory path for storing entries on disk. Entries are pickled, so only use trusted directories.
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.dirpath = dirpath
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self):
+        """ dict : Number of hits, misses, evictions and the current number of entries in memory. """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self)}
+
+    def _is_expired(self, timestamp):
+        """ bool : Checks if an entry created at the given time stamp is expired. """
+        return self.ttl is not None and (time.time() - timestamp) > self.ttl
+
+    def _get_filepath(self, key):
+        """ str : Full file path of the on-disk entry of the given key. """
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.dirpath, key_hash + ".pkl")
+
+    def _read(self, key):
+        """ tuple : Time stamp and value of the on-disk entry of the given key or None. """
+        try:
+            with open(self._get_filepath(key), 'rb') as file:
+                entry_key, timestamp, value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return None
+
+        return (timestamp, value) if entry_key == key else None
+
+    def _write(self, key, timestamp, value):
+        """ Writes an entry to disk. """
+        os.makedirs(self.dirpath, exist_ok=True)
+        filepath = self._get_filepath(key)
+        tmp_filepath = "{}.{}.tmp".format(filepath, os.getpid())
+        with open(tmp_filepath, 'wb') as file:
+            pickle.dump((key, timestamp, value), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for the given key.
+
+        Parameters
+        ----------
+        key : object
+            Hashable key of the entry.
+        default : object, optional
+            Value returned if the key is not cached or expired.
+
+        Returns
+        -------
+        object
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.dirpath is not None:
+                entry = self._read(key)
+                if entry is not None:
+                    self._store(key, entry)
+
+            if entry is None or self._is_expired(entry[0]):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        """
+        Stores a value for the given key.
+
+        Parameters
+        ----------
+        key : object
+            Hashable key of the entry.
+        value : object
+            Value to store.
+
+        """
+        with self._lock:
+            entry = (time.time(), value)
+            self._store(key, entry)
+            if self.dirpath is not None:
+                self._write(key, *entry)
+
+    def _store(self, key, entry):
+        """ Stores an entry in memory and evicts the least recently used entries. """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """ Removes all entries from memory and resets the statistics. On-disk entries are kept. """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __contains__(self, key):
+        """ bool : Checks if a valid entry is stored in memory for the given key. """
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry[0])
+
+    def __len__(self):
+        """ int : Number of entries in memory. """
+        return len(self._entries)
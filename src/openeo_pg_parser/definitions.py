@@ -1,12 +1,23 @@
 import os
 from json import load
+from types import MappingProxyType
+from openeo_pg_parser.cache import LRUCache
 from openeo_pg_parser.utils import load_processes
 from openeo_pg_parser.utils import get_obj_elem_from_keys
 from openeo_pg_parser.utils import walk_process_dictionary
 
 
 class OpenEOProcess:
-    """ Class representing an OpenEO process definition. """
+    """
+    Class representing an OpenEO process definition. Instances are immutable and their parameter tables are only
+    computed once.
+    """
+
+    __slots__ = ('_definition', '_parameters', '_sub_parameters')
+
+    # instances created by `from_name`, keyed by the identity of their process definition
+    instances = LRUCache(maxsize=1024)
+
     def __init__(self, process_def):
         """
         Constructor of `OpenEOProcess` class.
@@ -17,7 +28,50 @@ class OpenEOProcess:
             A dictionary defining an openEO process definition/schema.
 
         """
-        self.definition = process_def
+        object.__setattr__(self, '_definition', process_def)
+        object.__setattr__(self, '_parameters', None)
+        object.__setattr__(self, '_sub_parameters', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'OpenEOProcess' instances are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("'OpenEOProcess' instances are immutable.")
+
+    def __reduce__(self):
+        """ tuple : Pickles the instance by its process definition. """
+        return self.__class__.from_definition, (self._definition,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def from_definition(cls, process_def):
+        """
+        Returns the `OpenEOProcess` instance of a process definition, i.e. only one instance is created per process
+        definition.
+
+        Parameters
+        ----------
+        process_def : dict
+            A dictionary defining an openEO process definition/schema.
+
+        Returns
+        -------
+        OpenEOProcess
+
+        """
+        key = (cls, id(process_def))
+        process = cls.instances.get(key)
+        # the instance keeps a reference to its definition, so the ID can't be reused by another definition
+        if process is None or process.definition is not process_def:
+            process = cls(process_def)
+            cls.instances.set(key, process)
+
+        return process
 
     @classmethod
     def from_file(cls, filepath):
@@ -65,7 +119,7 @@ class OpenEOProcess:
 
         # use standard directory
         if src is None:
-            src = os.path.join(os.path.dirname(__file__), "..", "..", "processes")
+            src = os.path.join(os.path.dirname(__file__), "processes")
 
         processes = load_processes(src)
 
@@ -73,7 +127,17 @@ class OpenEOProcess:
             err_msg = "Process '{}' could not be found in the list of processes.".format(name)
             raise ValueError(err_msg)
         else:
-            return cls(processes[name])
+            return cls.from_definition(processes[name])
+
+    @property
+    def definition(self):
+        """ dict : Process definition/schema. """
+        return self._definition
+
+    @property
+    def full_definition(self):
+        """ dict : Process definition including its documentation, which is loaded for runtime catalogs. """
+        return getattr(self._definition, 'full_definition', self._definition)
 
     @property
     def id(self):
@@ -83,47 +147,50 @@ class OpenEOProcess:
     @property
     def description(self):
         """ str : Description of the process. """
-        return self.definition.get('description')
+        return self.full_definition.get('description')
 
     @property
     def parameters(self):
         """
-        dict : Dictionary containing the process argument names as keys and parameter definitions
+        mappingproxy : Read-only dictionary containing the process argument names as keys and parameter definitions
         (`OpenEOParameter` instances) as values.
 
         """
-        parameters = {}
-        for param_def in self.definition['parameters']:
-            parameter = OpenEOParameter(param_def)
-            parameters[parameter.name] = parameter
+        if self._parameters is None:
+            parameters = {}
+            for param_def in self.definition['parameters']:
+                parameter = OpenEOParameter(param_def)
+                parameters[parameter.name] = parameter
+            object.__setattr__(self, '_parameters', MappingProxyType(parameters))
 
-        return parameters
+        return self._parameters
 
     @property
     def sub_parameters(self):
         """
-        dict : Dictionary containing the process argument names as keys and parameter definitions
+        mappingproxy : Read-only dictionary containing the process argument names as keys and parameter definitions
         (`OpenEOParameter` instances) as values for sub-processes.
 
         """
-        sub_parameters = {}
-        for param_def in self.definition['parameters']:
-            parameter = OpenEOParameter(param_def)
-            keys_lineage, _, _, _ = walk_process_dictionary(parameter.schema)
-            keys_done = []
-            for key_lineage in keys_lineage:
-                if 'parameters' not in key_lineage:  # continue if 'parameter' is not in the list of keys
-                    continue
-                keys = key_lineage[:key_lineage.index('parameters')+1]
-                if keys in keys_done:  # continue if the keys were already used
-                    continue
-                keys_done.append(keys)
-                sub_param_defs = get_obj_elem_from_keys(parameter.schema, keys)
-                for sub_param_def in sub_param_defs:
-                    sub_parameter = OpenEOParameter(sub_param_def)
-                    sub_parameters.update({sub_parameter.name: sub_parameter})
-
-        return sub_parameters
+        if self._sub_parameters is None:
+            sub_parameters = {}
+            for parameter in self.parameters.values():
+                keys_lineage, _, _, _ = walk_process_dictionary(parameter.schema)
+                keys_done = []
+                for key_lineage in keys_lineage:
+                    if 'parameters' not in key_lineage:  # continue if 'parameter' is not in the list of keys
+                        continue
+                    keys = key_lineage[:key_lineage.index('parameters')+1]
+                    if keys in keys_done:  # continue if the keys were already used
+                        continue
+                    keys_done.append(keys)
+                    sub_param_defs = get_obj_elem_from_keys(parameter.schema, keys)
+                    for sub_param_def in sub_param_defs:
+                        sub_parameter = OpenEOParameter(sub_param_def)
+                        sub_parameters.update({sub_parameter.name: sub_parameter})
+            object.__setattr__(self, '_sub_parameters', MappingProxyType(sub_parameters))
+
+        return self._sub_parameters
 
     @property
     def is_reducer(self):
@@ -138,7 +205,7 @@ class OpenEOProcess:
     @property
     def exceptions(self):
         """ dict : Returns 'exceptions' schema of the process. """
-        return self.definition.get('exceptions')
+        return self.full_definition.get('exceptions')
 
     @property
     def process_graph(self):
@@ -149,6 +216,8 @@ class OpenEOProcess:
 class OpenEOParameter:
     """ Class representing an OpenEO parameter definition. """
 
+    __slots__ = ('definition',)
+
     def __init__(self, param_def):
         """
         Constructor of `OpenEOParameter` class.
@@ -198,4 +267,53 @@ class OpenEOParameter:
         str
 
         """
-        return str(self.definition)
\ No newline at end of file
+        return str(self.definition)
+
+
+class OpenEOCollection:
+    """ Class representing an openEO collection definition. """
+
+    def __init__(self, collection_def):
+        """
+        Constructor of `OpenEOCollection` class.
+
+        Parameters
+        ----------
+        collection_def : dict
+            A dictionary defining an openEO collection.
+
+        """
+        self.definition = collection_def
+
+        bands = []
+        for collection_dim in collection_def.get('cube:dimensions', {}).values():
+            if collection_dim['type'] == 'bands':
+                bands.extend([band.lower() for band in collection_dim['values']])
+        self._bands = bands
+        self._band_set = frozenset(bands)
+
+    @property
+    def id(self):
+        """ str : ID of the collection. """
+        return self.definition['id']
+
+    @property
+    def bands(self):
+        """ list of str : Lower-cased band names of the collection in their original order. """
+        return self._bands
+
+    def has_band(self, band):
+        """
+        Checks if the collection has a band with the given (case insensitive) name.
+
+        Parameters
+        ----------
+        band : str
+            Name of the band.
+
+        Returns
+        -------
+        bool
+
+        """
+        return band.lower() in self._band_set
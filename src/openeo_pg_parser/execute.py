@@ -0,0 +1,310 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+class ProcessExecutionError(Exception):
+    """ Error raised by the callable of a process while executing a graph. """
+
+    def __init__(self, node_id, process_id, error):
+        """
+        Constructor of `ProcessExecutionError` class.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node, which failed.
+        process_id : str
+            Process ID of the node.
+        error : Exception
+            Error raised by the callable of the process.
+
+        """
+        super().__init__("Process '{}' of node '{}' failed: {}".format(process_id, node_id, error))
+        self.node_id = node_id
+        self.process_id = process_id
+        self.error = error
+
+
+class ExecutionCancelledError(Exception):
+    """ Error raised if the execution of a graph was cancelled (see `Executor.cancel`). """
+
+
+class ExecutionResult:
+    """ Results and timing of the execution of a graph. """
+
+    def __init__(self, results, timings, duration):
+        """
+        Constructor of `ExecutionResult` class.
+
+        Parameters
+        ----------
+        results : collections.OrderedDict
+            Ordered dictionary linking the node ID's with the results of their processes in order of completion.
+        timings : dict
+            Dictionary linking the node ID's with the execution time of their processes in seconds.
+        duration : float
+            Overall execution time of the graph in seconds, including scheduling.
+
+        """
+        self.results = results
+        self.timings = timings
+        self.duration = duration
+
+    @property
+    def process_time(self):
+        """ float : Sum of the execution times of all processes in seconds. """
+        return sum(self.timings.values())
+
+    def __getitem__(self, node_id):
+        """ object : Result of the process of the given node. """
+        return self.results[node_id]
+
+
+class ExecutionContext:
+    """
+    State of one execution of a graph, i.e. its pending futures and whether it was cancelled. A context can be
+    passed to `Executor.run` for cancelling this execution only, even before it started.
+    """
+
+    def __init__(self):
+        """ Constructor of `ExecutionContext` class. """
+        self.futures = {}
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        """ bool : True if the execution was cancelled. """
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """ Cancels the execution. Processes, which are already running, are completed. """
+        self._cancelled.set()
+        with self._lock:
+            for future in self.futures.keys():
+                future.cancel()
+
+    def add(self, future, node):
+        """ Registers a submitted process of a node, which is cancelled right away if the execution was cancelled. """
+        with self._lock:
+            self.futures[future] = node
+            if self.cancelled:
+                future.cancel()
+
+    def pop(self, future):
+        """ graph.OpenEONode : Removes a completed process and returns its node. """
+        with self._lock:
+            return self.futures.pop(future)
+
+    def clear(self):
+        """ Cancels and removes all pending processes. """
+        with self._lock:
+            for future in self.futures.keys():
+                future.cancel()
+            self.futures = {}
+
+
+def resolve_references(arguments, results):
+    """
+    Replaces all 'from_node' references in the arguments of a node by the results of the referenced nodes.
+
+    Parameters
+    ----------
+    arguments : dict or list or object
+        Arguments of a node (see `OpenEONode.arguments`).
+    results : dict
+        Dictionary linking the node ID's with the results of their processes.
+
+    Returns
+    -------
+    dict or list or object
+
+    Notes
+    -----
+    References to nodes without a result (e.g. hidden references of embedded process graphs to their parent
+    process) are kept as they are.
+
+    """
+    if isinstance(arguments, dict):
+        if len(arguments) == 1 and arguments.get('from_node') in results:
+            return results[arguments['from_node']]
+        return {key: resolve_references(value, results) for key, value in arguments.items()}
+    elif isinstance(arguments, list):
+        return [resolve_references(value, results) for value in arguments]
+
+    return arguments
+
+
+def run_process(func, arguments):
+    """
+    Runs the callable of a process and measures its execution time.
+
+    Parameters
+    ----------
+    func : callable
+        Callable of the process, which is called with the arguments as keyword arguments.
+    arguments : dict
+        Arguments of the node with all references being resolved.
+
+    Returns
+    -------
+    result : object
+        Result of the callable.
+    duration : float
+        Execution time in seconds.
+
+    """
+    start = time.perf_counter()
+    result = func(**arguments)
+
+    return result, time.perf_counter() - start
+
+
+class Executor:
+    """
+    Reference executor running a translated openEO process graph over a thread or process pool. Nodes are dispatched
+    as soon as their dependencies (see `OpenEONode.dependencies`) are done, i.e. embedded process graphs are run
+    before their parent process, which receives the result of the result process as its argument.
+
+    Notes
+    -----
+    Callbacks are not invoked by their parent process: the nodes of an embedded process graph are run once, with the
+    'from_parameter' references as resolved by the translation (see `translate.adjust_from_parameters`), i.e. with
+    the data inputs of the parent process or default values. References to the parent process itself, which are
+    created for parameters of parents without data inputs, are passed on unresolved as 'from_node' dictionaries.
+    """
+
+    def __init__(self, processes=None, max_workers=None, pool="thread"):
+        """
+        Constructor of `Executor` class.
+
+        Parameters
+        ----------
+        processes : dict, optional
+            Dictionary linking process ID's with callables (see `register`).
+        max_workers : int, optional
+            Maximum number of processes running concurrently (defaults to the default of the pool).
+        pool : str, optional
+            Type of the pool, i.e. "thread" (default) or "process". For a process pool, the callables, arguments and
+            results need to be picklable.
+
+        """
+        if pool not in ["thread", "process"]:
+            err_msg = "Pool type '{}' unknown, use 'thread' or 'process'.".format(pool)
+            raise ValueError(err_msg)
+
+        self.processes = {}
+        self.max_workers = max_workers
+        self.pool = pool
+        self._contexts = set()  # contexts of the running executions
+        self._lock = threading.Lock()
+        for process_id, func in (processes or {}).items():
+            self.register(process_id, func)
+
+    def register(self, process_id, func=None):
+        """
+        Registers a callable for a process. It is called with the arguments of a node as keyword arguments, with
+        all 'from_node' references being replaced by the results of the referenced nodes.
+
+        Parameters
+        ----------
+        process_id : str
+            Process ID.
+        func : callable, optional
+            Callable of the process. If not given, a decorator registering the decorated callable is returned.
+
+        Returns
+        -------
+        callable
+
+        """
+        if func is None:
+            return lambda func: self.register(process_id, func)
+
+        self.processes[process_id] = func
+
+        return func
+
+    def cancel(self):
+        """
+        Cancels all running executions. Processes, which are already running, are completed. Executions started
+        afterwards are not affected (see `ExecutionContext` for cancelling a single execution).
+        """
+        with self._lock:
+            contexts = list(self._contexts)
+        for context in contexts:
+            context.cancel()
+
+    def run(self, graph, context=None):
+        """
+        Executes a translated openEO process graph.
+
+        Parameters
+        ----------
+        graph : graph.Graph
+            Translated openEO process graph.
+        context : ExecutionContext, optional
+            State of this execution, which can be used for cancelling it. A new one is created if not given.
+
+        Returns
+        -------
+        ExecutionResult
+
+        Notes
+        -----
+        If a process fails, all pending processes are cancelled and a `ProcessExecutionError` is raised. If the
+        execution is cancelled, an `ExecutionCancelledError` is raised.
+        Each execution keeps its state in its own context, so an executor can run several graphs concurrently.
+
+        """
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+        missing_ids = sorted({node.process_id for node in graph.nodes} - set(self.processes.keys()))
+        if missing_ids:
+            err_msg = "No callables are registered for the processes {}.".format(missing_ids)
+            raise ValueError(err_msg)
+
+        start = time.perf_counter()
+        context = ExecutionContext() if context is None else context
+        plan = graph.plan()
+        results = OrderedDict()
+        timings = {}
+        pool_class = ThreadPoolExecutor if self.pool == "thread" else ProcessPoolExecutor
+        with self._lock:
+            self._contexts.add(context)
+        try:
+            with pool_class(max_workers=self.max_workers) as pool:
+                try:
+                    self._submit(pool, plan, results, context)
+                    while context.futures and not context.cancelled:
+                        done, _ = wait(list(context.futures.keys()), return_when=FIRST_COMPLETED)
+                        if context.cancelled:
+                            break
+
+                        for future in done:
+                            node = context.pop(future)
+                            try:
+                                results[node.id], timings[node.id] = future.result()
+                            except Exception as e:
+                                raise ProcessExecutionError(node.id, node.process_id, e) from e
+                            plan.done(node.id)
+                        self._submit(pool, plan, results, context)
+                finally:
+                    context.clear()
+        finally:
+            with self._lock:
+                self._contexts.discard(context)
+
+        if context.cancelled:
+            raise ExecutionCancelledError("Execution of the graph was cancelled.")
+
+        return ExecutionResult(results, timings, time.perf_counter() - start)
+
+    def _submit(self, pool, plan, results, context):
+        """ Submits all ready nodes of an execution plan to the pool, unless the execution was cancelled. """
+        for node in plan.get_ready():
+            if context.cancelled:
+                break
+            arguments = resolve_references(node.arguments, results)
+            context.add(pool.submit(run_process, self.processes[node.process_id], arguments), node)
@@ -1,11 +1,86 @@
 import copy
-import numpy as np
-from pprint import pformat
+import heapq
 from collections import OrderedDict
+from openeo_pg_parser import lazyjson
 from openeo_pg_parser.definitions import OpenEOProcess
 from openeo_pg_parser.definitions import OpenEOParameter
 
 
+# types of node contents, which do not need to be copied
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def copy_content(content, memo):
+    """
+    Deep copy of a node content, which is faster than `copy.deepcopy` for JSON-like contents.
+
+    Parameters
+    ----------
+    content : object
+        Content of a node.
+    memo : dict
+        Dictionary of already copied objects (see `copy.deepcopy`), preserving shared objects.
+
+    Returns
+    -------
+    object
+    """
+
+    if isinstance(content, IMMUTABLE_TYPES):
+        return content
+
+    content_copy = memo.get(id(content))
+    if content_copy is not None:
+        return content_copy
+
+    if type(content) is dict:
+        content_copy = {}
+        memo[id(content)] = content_copy
+        for key, value in content.items():
+            content_copy[key] = copy_content(value, memo)
+    elif type(content) is list:
+        content_copy = []
+        memo[id(content)] = content_copy
+        for value in content:
+            content_copy.append(copy_content(value, memo))
+    else:
+        content_copy = copy.deepcopy(content, memo)
+
+    return content_copy
+
+
+def unpickle_graph(nodes, edges):
+    """
+    Restores a graph from its flat pickle form (see `Graph.__reduce__`).
+
+    Parameters
+    ----------
+    nodes : list of tuple
+        Class, state (without edges) and edge indexes of each node.
+    edges : list of tuple
+        ID, name, ID's of the start and end node and the hidden flag of each edge.
+
+    Returns
+    -------
+    graph.Graph
+    """
+
+    nodes_restored = OrderedDict()
+    for node_class, state, _ in nodes:
+        node = node_class.__new__(node_class)
+        node.__dict__.update(state)
+        node._clear_edges()
+        nodes_restored[node.id] = node
+
+    edges = [Edge(id=edge_id, name=name, nodes=[nodes_restored[from_id], nodes_restored[to_id]], hidden=hidden)
+             for edge_id, name, from_id, to_id, hidden in edges]
+    for node, (_, _, edge_indexes) in zip(nodes_restored.values(), nodes):
+        for edge_index in edge_indexes:
+            node.add_edge(edges[edge_index])
+
+    return Graph(nodes_restored)
+
+
 class Node:
     """
     A node of a graph, containing information about its edges, an ID, a name and a sub-graph/dictionary.
@@ -32,8 +107,23 @@ class Node:
         self.id = id
         self.name = name
         self.content = content
-        self.edges = edges
         self.depth = depth
+        self._version = 0  # incremented whenever the edges change, see `Graph.version`
+        self._clear_edges()
+        for edge in edges or []:
+            self.add_edge(edge)
+
+    @property
+    def edges(self):
+        """ view : View on all edges related to this node, in the order they were added. """
+        return self._edges.values()
+
+    def _clear_edges(self):
+        """ Removes all edges of the node without updating the related nodes. """
+        self._version += 1
+        self._edges = OrderedDict()  # edges with their keys (see `Edge.key`)
+        # related nodes per link/edge name: first the descendants/children, then the ancestors/parents
+        self._relatives = ({}, {})
 
     def __str__(self):
         """
@@ -44,6 +134,7 @@ class Node:
         -------
         str
         """
+        from pprint import pformat  # imported here, since `pprint` is slow to import
 
         pg_str = pformat(self.content)
         repr_str = "Node ID: {} \nNode Name: {} \n{}".format(self.id, self.name, pg_str)
@@ -71,8 +162,16 @@ class Node:
         Returns
         -------
         graph.Graph
+
+        Notes
+        -----
+        If a link is given, the relatives are copied from the index of the node, so modifying the returned graph does
+        not affect the node.
         """
 
+        if link is not None:
+            return Graph(OrderedDict(self._relatives[ancestor].get(link, ())))
+
         idx = 1
         idx_other = 0
         if not ancestor:
@@ -82,10 +181,7 @@ class Node:
         relatives = []
         for edge in self.edges:
             if edge.nodes[idx].id == self.id:
-                if link is not None and edge.name == link:
-                    relatives.append(edge.nodes[idx_other])
-                elif link is None:
-                    relatives.append(edge.nodes[idx_other])
+                relatives.append(edge.nodes[idx_other])
 
         return Graph.from_list(relatives)
 
@@ -188,23 +284,52 @@ class Node:
         graph.Node
         """
 
-        add_egde = True
-        for edge_this in self.edges:
-            if edge_this == edge:
-                add_egde = False
+        key = edge.key
+        if key not in self._edges:
+            self._edges[key] = edge
+            self._index_edge(edge)
+            self._version += 1
+
+        return self
 
-        if add_egde:
-            self.edges.append(edge)
+    def remove_edge(self, edge):
+        """
+        Removes an edge from the node if given.
+
+        Parameters
+        ----------
+        edge : graph.Edge
+            Edge connecting two nodes.
+
+        Returns
+        -------
+        graph.Node
+        """
+
+        if self._edges.pop(edge.key, None) is not None:
+            self._version += 1
+            for idx, edge_node in enumerate(edge.nodes):
+                if edge_node.id != self.id:
+                    self._relatives[idx == 0].get(edge.name, {}).pop(edge_node.id, None)
 
         return self
 
+    def _index_edge(self, edge):
+        """ Adds the other node of an edge to the relatives of the node, i.e. the start node is an ancestor. """
+        for idx, edge_node in enumerate(edge.nodes):
+            if edge_node.id != self.id:
+                self._relatives[idx == 0].setdefault(edge.name, OrderedDict())[edge_node.id] = edge_node
+
     def __eq__(self, other):
         """ bool : Checks if two nodes are equal. """
         return self.id == other.id
 
 
 class Edge:
-    """ An edge connects two nodes. The connection has a label/name. """
+    """
+    An edge connects two nodes. The connection has a label/name. Edges are identified by the ID's of their nodes and
+    their name (see `Edge.key`).
+    """
 
     def __init__(self, id=None, name=None, nodes=None, hidden=False):
         """
@@ -238,6 +363,15 @@ class Edge:
         """ list : Returns the node ID's of the two edge nodes. """
         return [node.id for node in self.nodes]
 
+    @property
+    def key(self):
+        """ tuple : Identity of the edge, i.e. the ID's of the start and end node and the name. """
+        return self.nodes[0].id, self.nodes[1].id, self.name
+
+    def __hash__(self):
+        """ int : Hash of the edge identity (see `Edge.key`). """
+        return hash(self.key)
+
     def __eq__(self, other):
         """
         Checks if two edges are equal, i.e. if the nodes and their order are the same.
@@ -253,9 +387,10 @@ class Edge:
             True if two edges are equal.
         """
 
-        return (self.nodes[0].id == other.nodes[0].id) & \
-               (self.nodes[1].id == other.nodes[1].id) & \
-               (self.name == other.name)
+        if not isinstance(other, Edge):
+            return NotImplemented
+
+        return self.key == other.key
 
 
 class Graph:
@@ -272,6 +407,9 @@ class Graph:
         """
 
         self._nodes = nodes
+        self._version = 0  # incremented whenever nodes are added or removed, see `version`
+        self._dependency_cache = None  # graph version and the dependencies of all nodes, see `_get_dependencies`
+        self._sort_cache = None  # graph version and the nodes sorted by dependency
 
     @property
     def nodes(self):
@@ -283,6 +421,19 @@ class Graph:
         """ view : View on Node ID's. """
         return self._nodes.keys()
 
+    @property
+    def version(self):
+        """
+        tuple : State of the graph, which changes whenever nodes are added to or removed from the graph or the edges
+        of its nodes change. It is used for invalidating cached sort orders and dependencies.
+        """
+        return self._version, sum(node._version for node in self._nodes.values())
+
+    @property
+    def edges(self):
+        """ set : All edges related to the nodes of the graph. """
+        return {edge for node in self.nodes for edge in node.edges}
+
     @property
     def max_depth(self):
         """ int : Maximum depth of the graph, if it has a tree-like structure. """
@@ -310,6 +461,121 @@ class Graph:
 
         return cls(nodes_dict)
 
+    def copy(self, copy_contents=True):
+        """
+        Copies the graph, i.e. its nodes, their contents and all edges between them. Contents shared between nodes
+        (e.g., embedded process graphs) are also shared in the copy.
+
+        Parameters
+        ----------
+        copy_contents : bool, optional
+            If false, the node copies share their contents with the original nodes (default is True).
+
+        Returns
+        -------
+        graph.Graph
+        """
+
+        memo = {}
+        nodes = OrderedDict()
+        for node_id, node in self._nodes.items():
+            node_copy = node.__class__.__new__(node.__class__)
+            node_copy.__dict__.update(node.__dict__)
+            if copy_contents:
+                node_copy.content = copy_content(node.content, memo)
+            node_copy._clear_edges()
+            nodes[node_id] = node_copy
+
+        # the edges and relatives of each node are copied directly instead of being indexed again (see `add_edge`)
+        edges = {}
+        for node_id, node in self._nodes.items():
+            node_copy = nodes[node_id]
+            for key, edge in node._edges.items():
+                edge_copy = edges.get(id(edge))
+                if edge_copy is None:
+                    edge_nodes = [nodes.get(edge_node.id, edge_node) for edge_node in edge.nodes]
+                    edge_copy = Edge(id=edge.id, name=edge.name, nodes=edge_nodes, hidden=edge.hidden)
+                    edges[id(edge)] = edge_copy
+                node_copy._edges[key] = edge_copy
+            for relatives, relatives_copy in zip(node._relatives, node_copy._relatives):
+                for link, link_relatives in relatives.items():
+                    relatives_copy[link] = OrderedDict((relative_id, nodes.get(relative_id, relative))
+                                                       for relative_id, relative in link_relatives.items())
+
+        return Graph(nodes)
+
+    def __reduce__(self):
+        """
+        Returns a flat pickle form of the graph, i.e. the states of the nodes without their edges and a list of all
+        edges between them. Otherwise, pickling would recurse along connected nodes and fail for long paths. Edges to
+        nodes outside of the graph are not pickled.
+
+        Returns
+        -------
+        tuple
+        """
+
+        edge_indexes = {}
+        edges = []
+        nodes = []
+        for node in self._nodes.values():
+            state = node.__dict__.copy()
+            del state['_edges'], state['_relatives']
+            node_edge_indexes = []
+            for edge in node.edges:
+                if edge.nodes[0].id not in self._nodes or edge.nodes[1].id not in self._nodes:
+                    continue
+                if id(edge) not in edge_indexes:
+                    edge_indexes[id(edge)] = len(edges)
+                    edges.append((edge.id, edge.name, edge.nodes[0].id, edge.nodes[1].id, edge.hidden))
+                node_edge_indexes.append(edge_indexes[id(edge)])
+            nodes.append((node.__class__, state, node_edge_indexes))
+
+        return unpickle_graph, (nodes, edges)
+
+    def add_node(self, node):
+        """
+        Adds a node to the graph. Its edges are kept as they are.
+
+        Parameters
+        ----------
+        node : graph.Node
+            Node to add.
+
+        Returns
+        -------
+        graph.Graph
+        """
+
+        self._nodes[node.id] = node
+        self._version += 1
+
+        return self
+
+    def remove_node(self, node_id):
+        """
+        Removes a node from the graph, including all edges between this node and other nodes.
+
+        Parameters
+        ----------
+        node_id : int or str
+            ID of the node to remove.
+
+        Returns
+        -------
+        graph.Node
+            Removed node.
+        """
+
+        node = self._nodes.pop(node_id)
+        self._version += 1
+        for edge in node.edges:
+            for edge_node in edge.nodes:
+                if edge_node is not node:
+                    edge_node.remove_edge(edge)
+
+        return node
+
     def __len__(self):
         """ int : number of nodes in the graph. """
         return len(self.nodes)
@@ -476,6 +742,7 @@ class Graph:
         ----------
         by : str
             Sorting strategy:
+                - 'depth': Sorts graph by the depth of each node (default).
                 - 'dependency': Sorts graph by each node dependency,
                                 i.e., nodes being dependent on another node come after this node.
 
@@ -483,21 +750,104 @@ class Graph:
         -------
         graph.Graph
             Sorted graph.
+
+        Notes
+        -----
+        Sorting by dependency is a topological sort (Kahn's algorithm) in linear time. Nodes, which do not depend on
+        each other, keep their order in the graph. The order is cached until the graph changes (see `version`).
+        A `ValueError` is raised if the dependencies contain a cycle.
         """
 
         if by == "depth":
-            depths = [node.depth for node in self.nodes]
-            node_order = np.argsort(depths)
-            nodes_ordered = np.array(list(self.nodes))[node_order].tolist()
+            nodes_ordered = sorted(self.nodes, key=lambda node: node.depth)
+        elif by == "dependency":
+            version = self.version
+            if self._sort_cache is None or self._sort_cache[0] != version:
+                self._sort_cache = (version, self._sort_by_dependency())
+            nodes_ordered = self._sort_cache[1]
         else:
             err_msg = "Sorting strategy '{}' unknown ".format(by)
             raise ValueError(err_msg)
 
         return Graph.from_list(nodes_ordered)
 
+    def _get_dependencies(self):
+        """
+        Collects the dependencies of all nodes within the graph (see `Node.dependencies`). Dependencies, which are only
+        connected by hidden edges, are ignored.
+
+        Returns
+        -------
+        collections.OrderedDict
+            Ordered dictionary linking the node ID's with the list of ID's of the nodes they depend on.
+        """
+
+        version = self.version
+        if self._dependency_cache is not None and self._dependency_cache[0] == version:
+            return self._dependency_cache[1]
+
+        dependencies = OrderedDict()
+        for node_id, node in self._nodes.items():
+            hidden_ids = set()
+            visible_ids = set()
+            for edge in node.edges:
+                if edge.nodes[1] is node:
+                    (hidden_ids if edge.hidden else visible_ids).add(edge.nodes[0].id)
+            hidden_ids -= visible_ids
+            dependencies[node_id] = [dependency.id for dependency in node.dependencies.nodes
+                                     if dependency.id in self._nodes and dependency.id not in hidden_ids]
+
+        self._dependency_cache = (version, dependencies)
+
+        return dependencies
+
+    def _sort_by_dependency(self):
+        """ list : Nodes sorted topologically, ties are broken by the position of the nodes in the graph. """
+        dependencies = self._get_dependencies()
+        positions = {node_id: position for position, node_id in enumerate(self._nodes.keys())}
+        node_ids = list(self._nodes.keys())
+
+        n_dependencies = {}
+        dependents = {node_id: [] for node_id in node_ids}
+        for node_id, dependency_ids in dependencies.items():
+            n_dependencies[node_id] = len(dependency_ids)
+            for dependency_id in dependency_ids:
+                dependents[dependency_id].append(node_id)
+
+        ready = [positions[node_id] for node_id in node_ids if n_dependencies[node_id] == 0]
+        heapq.heapify(ready)
+        nodes_ordered = []
+        while ready:
+            node_id = node_ids[heapq.heappop(ready)]
+            nodes_ordered.append(self._nodes[node_id])
+            for dependent_id in dependents[node_id]:
+                n_dependencies[dependent_id] -= 1
+                if n_dependencies[dependent_id] == 0:
+                    heapq.heappush(ready, positions[dependent_id])
+
+        if len(nodes_ordered) != len(node_ids):
+            cycle_ids = [node_id for node_id in node_ids if n_dependencies[node_id] > 0]
+            err_msg = "Graph cannot be sorted by dependency, since the nodes {} are part of or depend on a " \
+                      "cycle.".format(cycle_ids)
+            raise ValueError(err_msg)
+
+        return nodes_ordered
+
+    def plan(self):
+        """
+        Creates an execution plan of the graph, grouping the nodes into waves of nodes, which can run concurrently.
+
+        Returns
+        -------
+        graph.ExecutionPlan
+        """
+
+        return ExecutionPlan(self)
+
     def update(self):
         """
-        Updates all edges and their nodes in a graph.
+        Updates all edges and their nodes in a graph. This is only needed if edges were added to a single node,
+        e.g. with `Node.add_edge`, since edges created with `translate.create_edge` are added to both nodes.
 
         Returns
         -------
@@ -514,6 +864,116 @@ class Graph:
         return self
 
 
+class ExecutionPlan:
+    """
+    Execution plan of a graph, i.e. its nodes grouped into dependency waves and a ready set, which can be driven by
+    a scheduler as nodes complete.
+    """
+
+    def __init__(self, graph):
+        """
+        Constructor of `ExecutionPlan` class.
+
+        Parameters
+        ----------
+        graph : graph.Graph
+            Graph to plan. Dependencies are defined as for `Graph.sort(by='dependency')`.
+
+        """
+        self.graph = graph
+        self.dependencies = graph._get_dependencies()
+        self.dependents = {node_id: [] for node_id in self.dependencies.keys()}
+        for node_id, dependency_ids in self.dependencies.items():
+            for dependency_id in dependency_ids:
+                self.dependents[dependency_id].append(node_id)
+
+        # wave of each node, i.e. the length of the longest chain of dependencies leading to the node
+        self.node_waves = {}
+        waves = []
+        for node in graph.sort(by='dependency').nodes:
+            wave = max([self.node_waves[dependency_id] + 1 for dependency_id in self.dependencies[node.id]],
+                       default=0)
+            self.node_waves[node.id] = wave
+            if wave == len(waves):
+                waves.append([])
+        for node in graph.nodes:
+            waves[self.node_waves[node.id]].append(node)
+        self.waves = [Graph.from_list(wave) for wave in waves]
+
+        self._n_dependencies = None
+        self._ready = None
+        self._n_done = None
+        self.reset()
+
+    @property
+    def widths(self):
+        """ list of int : Number of nodes of each wave. """
+        return [len(wave) for wave in self.waves]
+
+    @property
+    def max_width(self):
+        """ int : Maximum number of nodes, which can run concurrently according to the waves. """
+        return max(self.widths, default=0)
+
+    @property
+    def parallelism(self):
+        """ float : Average number of nodes per wave, i.e. the number of nodes divided by the critical path length. """
+        return len(self.graph) / len(self.waves) if self.waves else 0.
+
+    @property
+    def stats(self):
+        """ dict : Number of nodes and waves, the wave widths, the maximum width and the average parallelism. """
+        return {'n_nodes': len(self.graph), 'n_waves': len(self.waves), 'widths': self.widths,
+                'max_width': self.max_width, 'parallelism': self.parallelism}
+
+    def reset(self):
+        """ Resets the ready set, i.e. no node is marked as done. """
+        self._n_dependencies = {node_id: len(dependency_ids)
+                                for node_id, dependency_ids in self.dependencies.items()}
+        self._ready = [node_id for node_id, n_dependencies in self._n_dependencies.items() if n_dependencies == 0]
+        self._n_done = 0
+
+    def get_ready(self):
+        """
+        Returns all nodes, which became ready since the last call, i.e. whose dependencies are done.
+
+        Returns
+        -------
+        list of graph.Node
+        """
+
+        ready = [self.graph[node_id] for node_id in self._ready]
+        self._ready = []
+
+        return ready
+
+    def done(self, *node_ids):
+        """
+        Marks nodes as done, which makes nodes depending on them ready if all their dependencies are done.
+
+        Parameters
+        ----------
+        *node_ids : str
+            ID's of nodes returned by `get_ready`.
+
+        """
+        for node_id in node_ids:
+            if self._n_dependencies.get(node_id) != 0:
+                err_msg = "Node '{}' is not ready or was already marked as done.".format(node_id)
+                raise ValueError(err_msg)
+
+            self._n_dependencies[node_id] = -1
+            self._n_done += 1
+            for dependent_id in self.dependents[node_id]:
+                self._n_dependencies[dependent_id] -= 1
+                if self._n_dependencies[dependent_id] == 0:
+                    self._ready.append(dependent_id)
+
+    def is_active(self):
+        """ bool : True as long as not all nodes are done. """
+        return self._n_done < len(self.dependencies)
+
+
 class OpenEONode(Node):
     """
     A node of an openEO process graph, containing information about its edges, an ID, a name, its arguments,
@@ -522,7 +982,7 @@ class OpenEONode(Node):
     """
 
     def __init__(self, id=None, name=None, content=None, edges=None, depth=None, processes_src=None,
-                 keys=None):
+                 keys=None, references=None):
         """
         Constructor of `graph.Node`.
 
@@ -547,12 +1007,16 @@ class OpenEONode(Node):
                 - list of loaded process definitions
         keys : list of str, optional
             List of process graph dictionary keys pointing to the node.
+        references : dict, optional
+            Dictionary with the reference types "from_node", "from_parameter" and "process_graph" as keys and lists
+            of keys pointing to these references within the node arguments as values.
 
         """
         super().__init__(id=id, name=name, content=content, edges=edges, depth=depth)
 
         self.process = OpenEOProcess.from_name(self.process_id, src=processes_src)
         self.keys = keys
+        self.references = references
 
     @property
     def process_id(self):
@@ -561,11 +1025,11 @@ class OpenEONode(Node):
 
     @property
     def arguments(self):
-        """ dict : Returns the arguments of an openEO process. """
+        """ dict : Returns the arguments of an openEO process, with all raw literals being parsed (see `lazyjson`). """
 
         if self.content is not None:
             exp_args = self.process.parameters
-            args = copy.deepcopy(self.content['arguments'])
+            args = lazyjson.resolve(self.content['arguments'])
             for exp_arg_name in exp_args.keys():
                 if exp_arg_name not in args.keys():
                     args[exp_arg_name] = exp_args[exp_arg_name].default_value
@@ -598,12 +1062,12 @@ class OpenEONode(Node):
             Direct dependencies of this node as a sub-graph.
 
         """
-        data_dependencies = list(self.ancestors(link="data").nodes)  # get input data nodes
-        result_dependency = self.result_process # get result process node
-
-        dependencies = data_dependencies if result_dependency is None else data_dependencies + [result_dependency]
+        data_dependencies = self.ancestors(link="data")  # get input data nodes
+        result_dependency = self.result_process  # get result process node
+        if result_dependency is None:
+            return data_dependencies
 
-        return Graph.from_list(dependencies)
+        return Graph.from_list(list(data_dependencies.nodes) + [result_dependency])
 
     @property
     def parent_process(self):
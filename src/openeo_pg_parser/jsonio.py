@@ -0,0 +1,146 @@
+import os
+import json
+
+
+# supported JSON backends in the order of preference
+BACKENDS = ("orjson", "json")
+
+# JSON backend used if no other backend is set, by default the first available one of `BACKENDS`
+DEFAULT_BACKEND = os.environ.get("OPENEO_PG_PARSER_JSON_BACKEND")
+
+# name and functions of the JSON backend in use (see `set_json_backend`)
+BACKEND = None
+LOADS = None
+DUMPS = None
+
+
+def stdlib_loads(data):
+    """ object : Parses a JSON document with the standard library. """
+    if isinstance(data, memoryview):
+        data = bytes(data)
+
+    return json.loads(data)
+
+
+def stdlib_dumps(obj, sort_keys=False, default=None):
+    """ bytes : Serializes an object to a compact JSON document with the standard library. """
+    document = json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False, default=default)
+    return document.encode("utf-8")
+
+
+def set_json_backend(name=None):
+    """
+    Sets the JSON backend used for loading and serializing process graphs, process definitions and collections.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the backend, i.e. one of `BACKENDS`. If None, `DEFAULT_BACKEND` or the first installed backend of
+        `BACKENDS` is used.
+
+    Returns
+    -------
+    str
+        Name of the backend in use.
+
+    """
+    global BACKEND, LOADS, DUMPS
+
+    name = DEFAULT_BACKEND if name is None else name
+    if name is None:
+        for backend_name in BACKENDS:
+            try:
+                return set_json_backend(backend_name)
+            except ValueError:
+                continue
+
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            raise ValueError("JSON backend 'orjson' is not installed.")
+
+        def orjson_dumps(obj, sort_keys=False, default=None):
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+            try:
+                return orjson.dumps(obj, default=default, option=option)
+            except orjson.JSONEncodeError:  # e.g. integers exceeding 64 bit
+                return stdlib_dumps(obj, sort_keys=sort_keys, default=default)
+
+        LOADS, DUMPS = orjson.loads, orjson_dumps
+    elif name == "json":
+        LOADS, DUMPS = stdlib_loads, stdlib_dumps
+    else:
+        err_msg = "JSON backend '{}' unknown, use one of {}.".format(name, list(BACKENDS))
+        raise ValueError(err_msg)
+
+    BACKEND = name
+    return BACKEND
+
+
+def get_json_backend():
+    """ str : Name of the JSON backend in use, which is set on first use (see `set_json_backend`). """
+    return set_json_backend() if BACKEND is None else BACKEND
+
+
+def loads(data):
+    """
+    Parses a JSON document with the backend in use.
+
+    Parameters
+    ----------
+    data : str or bytes or bytearray or memoryview
+        JSON document. Binary input is parsed without decoding it to a string first, if the backend supports it.
+
+    Returns
+    -------
+    object
+
+    """
+    if LOADS is None:
+        set_json_backend()
+
+    return LOADS(data)
+
+
+def dumps(obj, sort_keys=False, default=None):
+    """
+    Serializes an object to a compact JSON document with the backend in use.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize.
+    sort_keys : bool, optional
+        If true, the keys of all dictionaries are sorted (default is False).
+    default : callable, optional
+        Function converting objects, which cannot be serialized otherwise.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON document.
+
+    """
+    if DUMPS is None:
+        set_json_backend()
+
+    return DUMPS(obj, sort_keys=sort_keys, default=default)
+
+
+def load(filepath):
+    """
+    Loads a JSON file with the backend in use.
+
+    Parameters
+    ----------
+    filepath : str
+        Full file path to JSON file.
+
+    Returns
+    -------
+    object
+
+    """
+    with open(filepath, 'rb') as file:
+        return loads(file.read())
@@ -0,0 +1,228 @@
+import re
+import copy
+import json
+from json.decoder import scanstring
+from openeo_pg_parser import jsonio
+
+
+# size (number of characters) from which JSON arrays and objects without references are kept as raw text
+MIN_RAW_SIZE = 4096
+
+# JSON strings marking arrays and objects, which need to be parsed for translating a process graph
+MARKERS = frozenset(['"process_graph"', '"process_id"', '"from_node"', '"from_parameter"'])
+# keys of arrays and objects, which always need to be parsed
+PARSED_KEYS = frozenset(['"arguments"'])
+# keys of arrays and objects, which always need to be parsed including all nested arrays and objects (e.g. parameter
+# definitions read while translating)
+PARSED_TREE_KEYS = frozenset(['"parameters"'])
+
+TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+
+class RawJSON:
+    """
+    Unparsed JSON array or object, which was a span of a JSON document. Only the UTF-8 encoded text of the span is
+    kept, i.e. not the whole document, and it is only parsed when its value is requested.
+    """
+
+    __slots__ = ('raw', '_value')
+
+    def __init__(self, raw):
+        """
+        Constructor of `RawJSON` class.
+
+        Parameters
+        ----------
+        raw : bytes or str
+            JSON text of the array or object.
+
+        """
+        self.raw = raw.encode("utf-8") if isinstance(raw, str) else bytes(raw)
+        self._value = None
+
+    @property
+    def value(self):
+        """ list or dict : Parsed array or object. """
+        if self._value is None:
+            self._value = jsonio.loads(self.raw)
+
+        return self._value
+
+    def __len__(self):
+        """ int : Number of bytes of the JSON text. """
+        return len(self.raw)
+
+    def __eq__(self, other):
+        """ bool : Compares the parsed values. """
+        other = other.value if isinstance(other, RawJSON) else other
+        return self.value == other
+
+    def __reduce__(self):
+        """ tuple : Only the JSON text is pickled, not the parsed value. """
+        return self.__class__, (self.raw,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "RawJSON({} bytes)".format(len(self))
+
+
+def resolve(obj):
+    """
+    Copies a JSON-like object and replaces all `RawJSON` instances by (copies of) their parsed values.
+
+    Parameters
+    ----------
+    obj : object
+        Object possibly containing `RawJSON` instances, e.g. the arguments of a node.
+
+    Returns
+    -------
+    object
+
+    """
+    if isinstance(obj, RawJSON):
+        return copy.deepcopy(obj.value)
+    elif isinstance(obj, dict):
+        return {key: resolve(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [resolve(value) for value in obj]
+
+    return copy.deepcopy(obj)
+
+
+def find_raw_spans(document, min_raw_size=None):
+    """
+    Finds all arrays and objects in a JSON document, which can be kept as raw text, i.e. which are large enough and
+    do not contain any references or process graphs (see `MARKERS`). Arrays and objects of certain keys are always
+    parsed (see `PARSED_KEYS` and `PARSED_TREE_KEYS`).
+
+    Parameters
+    ----------
+    document : str
+        JSON document.
+    min_raw_size : int, optional
+        Minimum number of characters of an array or object kept as raw text (defaults to `MIN_RAW_SIZE`).
+
+    Returns
+    -------
+    raw_spans : dict
+        Dictionary linking the start index of each raw array or object with its end index.
+    partial_starts : set
+        Start indexes of all arrays and objects, which are not raw, but contain raw arrays or objects.
+
+    """
+    min_raw_size = MIN_RAW_SIZE if min_raw_size is None else min_raw_size
+    raw_spans = {}
+    partial_starts = set()
+    # each stack entry holds the start index of an array or object, if it contains a marker, if it contains raw
+    # arrays or objects, if it needs to be parsed because of its key and if all nested ones need to be parsed
+    stack = []
+    prev_token = None
+    for match in TOKEN_RE.finditer(document):
+        token = match.group()
+        if token[0] == '"':
+            if stack and token in MARKERS:
+                stack[-1][1] = True
+        elif token in "[{":
+            is_tree_parsed = prev_token in PARSED_TREE_KEYS or bool(stack and stack[-1][4])
+            stack.append([match.start(), False, False, prev_token in PARSED_KEYS or is_tree_parsed, is_tree_parsed])
+        else:
+            start, has_marker, has_raw, is_parsed, _ = stack.pop()
+            end = match.end()
+            if not has_marker and not is_parsed and end - start >= min_raw_size:
+                raw_spans[start] = end
+                has_raw = True
+            elif has_raw:
+                partial_starts.add(start)
+
+            if stack:
+                stack[-1][1] |= has_marker
+                stack[-1][2] |= has_raw
+        prev_token = token
+
+    return raw_spans, partial_starts
+
+
+def loads(document, min_raw_size=None):
+    """
+    Parses a JSON document, but keeps large arrays and objects without references as `RawJSON` instances.
+
+    Parameters
+    ----------
+    document : str or bytes or memoryview
+        JSON document.
+    min_raw_size : int, optional
+        Minimum number of characters of an array or object kept as raw text (defaults to `MIN_RAW_SIZE`).
+
+    Returns
+    -------
+    object
+
+    """
+    if not isinstance(document, str):
+        document = bytes(document).decode("utf-8")
+
+    raw_spans, partial_starts = find_raw_spans(document, min_raw_size=min_raw_size)
+    decoder = json.JSONDecoder()
+
+    def read_value(idx):
+        """ Reads a value, which is either complete or an empty container to be filled (third value is true). """
+        if idx in raw_spans:
+            return RawJSON(document[idx:raw_spans[idx]]), raw_spans[idx], False
+        elif idx in partial_starts:
+            return ({} if document[idx] == "{" else []), idx + 1, True
+        else:
+            value, idx = decoder.raw_decode(document, idx)
+            return value, idx, False
+
+    root, idx, is_open = read_value(WHITESPACE_RE.match(document, 0).end())
+    stack = [root] if is_open else []  # containers being filled
+    while stack:
+        container = stack[-1]
+        idx = WHITESPACE_RE.match(document, idx).end()
+        if document[idx] == ",":
+            idx = WHITESPACE_RE.match(document, idx + 1).end()
+        if document[idx] in "]}":
+            stack.pop()
+            idx += 1
+            continue
+
+        if isinstance(container, dict):
+            key, idx = scanstring(document, idx + 1)
+            idx = WHITESPACE_RE.match(document, idx).end() + 1  # skip ':'
+            value, idx, is_open = read_value(WHITESPACE_RE.match(document, idx).end())
+            container[key] = value
+        else:
+            value, idx, is_open = read_value(idx)
+            container.append(value)
+
+        if is_open:
+            stack.append(value)
+
+    return root
+
+
+def load(filepath, min_raw_size=None):
+    """
+    Loads a JSON file, but keeps large arrays and objects without references as `RawJSON` instances (see `loads`).
+
+    Parameters
+    ----------
+    filepath : str
+        Full file path to JSON file.
+    min_raw_size : int, optional
+        Minimum number of characters of an array or object kept as raw text (defaults to `MIN_RAW_SIZE`).
+
+    Returns
+    -------
+    object
+
+    """
+    with open(filepath, encoding="utf-8") as file:
+        return loads(file.read(), min_raw_size=min_raw_size)
@@ -0,0 +1,197 @@
+import os
+import json
+import hashlib
+import threading
+from urllib.parse import urlparse
+from openeo_pg_parser import jsonio
+
+
+# directory path of the on-disk HTTP cache, which is used if no other cache directory is given
+CACHE_DIRPATH = os.environ.get("OPENEO_PG_PARSER_CACHE_DIR")
+
+# shared HTTP session (see `get_session`) and its maximum number of pooled connections per host
+SESSION = None
+POOL_SIZE = 32
+SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the HTTP session shared by all requests of the parser, i.e. connections are pooled and reused.
+
+    Returns
+    -------
+    requests.Session
+
+    Notes
+    -----
+    `requests` is only imported when the first session is created to keep the import of the parser fast.
+
+    """
+    import requests
+
+    global SESSION
+    with SESSION_LOCK:
+        if SESSION is None:
+            SESSION = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            SESSION.mount("http://", adapter)
+            SESSION.mount("https://", adapter)
+
+    return SESSION
+
+
+def is_url(src):
+    """
+    Checks if the given source is an HTTP(S) URL.
+
+    Parameters
+    ----------
+    src : object
+        Source to check.
+
+    Returns
+    -------
+    bool
+
+    """
+    return isinstance(src, str) and urlparse(src).scheme in ["http", "https"]
+
+
+def get_cache_filepaths(url, cache_dirpath):
+    """
+    Returns the file paths of the cached content and its metadata for a given URL.
+
+    Parameters
+    ----------
+    url : str
+        URL of the resource.
+    cache_dirpath : str
+        Directory path of the HTTP cache.
+
+    Returns
+    -------
+    content_filepath : str
+    meta_filepath : str
+
+    """
+    url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    content_filepath = os.path.join(cache_dirpath, url_hash + ".json")
+    meta_filepath = os.path.join(cache_dirpath, url_hash + ".meta.json")
+
+    return content_filepath, meta_filepath
+
+
+def read_cache(url, cache_dirpath):
+    """
+    Reads the cached content and its metadata (URL, ETag, Last-Modified) for a given URL.
+
+    Parameters
+    ----------
+    url : str
+        URL of the resource.
+    cache_dirpath : str
+        Directory path of the HTTP cache.
+
+    Returns
+    -------
+    content : bytes
+        Cached content or None if the URL is not cached.
+    meta : dict
+        Cached metadata or None if the URL is not cached.
+
+    """
+    content_filepath, meta_filepath = get_cache_filepaths(url, cache_dirpath)
+    try:
+        with open(meta_filepath) as file:
+            meta = json.load(file)
+        with open(content_filepath, 'rb') as file:
+            content = file.read()
+    except (OSError, ValueError):
+        return None, None
+
+    if meta.get('url') != url:
+        return None, None
+
+    return content, meta
+
+
+def write_cache(url, cache_dirpath, content, etag=None, last_modified=None):
+    """
+    Writes content and its metadata to the cache. Existing cache entries are replaced atomically.
+
+    Parameters
+    ----------
+    url : str
+        URL of the resource.
+    cache_dirpath : str
+        Directory path of the HTTP cache.
+    content : bytes
+        Content of the response.
+    etag : str, optional
+        ETag header of the response.
+    last_modified : str, optional
+        Last-Modified header of the response.
+
+    """
+    os.makedirs(cache_dirpath, exist_ok=True)
+    content_filepath, meta_filepath = get_cache_filepaths(url, cache_dirpath)
+    meta = {'url': url, 'etag': etag, 'last_modified': last_modified}
+    for filepath, data in [(content_filepath, content), (meta_filepath, json.dumps(meta).encode("utf-8"))]:
+        tmp_filepath = "{}.{}.tmp".format(filepath, os.getpid())
+        with open(tmp_filepath, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_filepath, filepath)
+
+
+def fetch_json(url, cache_dirpath=None, timeout=None):
+    """
+    Downloads a JSON document with one request over the shared HTTP session.
+
+    Parameters
+    ----------
+    url : str
+        URL of the JSON document.
+    cache_dirpath : str, optional
+        Directory path of the on-disk HTTP cache (defaults to `CACHE_DIRPATH`). If a cache is used, the request is sent
+        conditionally (ETag/Last-Modified) and unchanged documents are taken from the cache.
+    timeout : float, optional
+        Timeout of the request in seconds.
+
+    Returns
+    -------
+    dict
+
+    Notes
+    -----
+    If the server cannot be reached, a cached version of the document is returned if available.
+
+    """
+    import requests
+
+    cache_dirpath = CACHE_DIRPATH if cache_dirpath is None else cache_dirpath
+    content, meta = (None, None) if cache_dirpath is None else read_cache(url, cache_dirpath)
+
+    headers = {}
+    if meta is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        r = get_session().get(url=url, headers=headers, timeout=timeout)
+    except (requests.ConnectionError, requests.Timeout):
+        if content is None:
+            raise
+        return jsonio.loads(content)  # offline: use cached version
+
+    if r.status_code == 304 and content is not None:
+        return jsonio.loads(content)
+
+    r.raise_for_status()
+    if cache_dirpath is not None:
+        write_cache(url, cache_dirpath, r.content, etag=r.headers.get('ETag'),
+                    last_modified=r.headers.get('Last-Modified'))
+
+    return jsonio.loads(r.content)
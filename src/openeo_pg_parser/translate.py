@@ -1,19 +1,36 @@
 import os
-import copy
+import hashlib
 from collections import OrderedDict
+from openeo_pg_parser import jsonio
+from openeo_pg_parser import lazyjson
+from openeo_pg_parser.cache import LRUCache
 from openeo_pg_parser.graph import OpenEONode, Edge, Graph
 from openeo_pg_parser.utils import set_obj_elem_from_keys
 from openeo_pg_parser.utils import get_obj_elem_from_keys
 from openeo_pg_parser.utils import load_processes
 from openeo_pg_parser.utils import load_json_file
+from openeo_pg_parser.utils import process_source_key
+from openeo_pg_parser.utils import LazyProcessCatalog
 from openeo_pg_parser.utils import walk_process_dictionary
 from openeo_pg_parser.definitions import OpenEOParameter
 
 
-def walk_process_graph(process_graph, nodes, process_defs, node_ids=None, level=0, keys=None):
+# keys of references recorded for each node while walking through a process graph
+REFERENCE_TYPES = ("from_node", "from_parameter", "process_graph")
+
+# translated process graphs, see `translate_process_graph(..., use_cache=True)`
+TRANSLATION_CACHE = LRUCache(maxsize=128)
+# keys of loaded process definitions (see `process_catalog_key`) by their identity; each entry holds a reference to
+# the process definitions, so their identity cannot be reused
+CATALOG_KEYS = LRUCache(maxsize=16)
+
+# process definitions loaded once per worker process of `translate_process_graphs`
+WORKER_PROCESS_DEFS = None
+
+
+def walk_process_graph(process_graph, nodes, process_defs, scopes=None, node=None, start_index=0):
     """
-    Recursively walks through an openEO process graph dictionary and transforms the dictionary into a list of graph
-    nodes.
+    Walks through an openEO process graph dictionary and transforms the dictionary into a list of graph nodes.
 
     Parameters
     ----------
@@ -27,65 +44,88 @@ def walk_process_graph(process_graph, nodes, process_defs, node_ids=None, level=
             - directory path to processes (.json)
             - URL of the remote process endpoint (e.g., "https://earthengine.openeo.org/v1.0/processes")
             - list of loaded process definitions
-    node_ids : list, optional
-        List of Node ID's for one dictionary branch (only internally used in the recursive process, can be ignored)
-    level : int, optional
-        Current level/deepness in the dictionary (default is 0,
-        only internally used in the recursive process, can be ignored).
-    keys : list of str
-        List of process graph dictionary keys pointing to the current node.
+    scopes : dict, optional
+        If given, it is filled with one name index per process graph (see `build_scopes`).
+    node : graph.OpenEONode, optional
+        If given, only the arguments of this existing node are walked through, i.e. `process_graph` is ignored and its
+        references are recorded anew.
+    start_index : int, optional
+        Number added to the number of nodes for creating the ID of a new node (default is 0).
 
     Returns
     -------
     nodes : collections.OrderedDict
-    node_ids : list
-    level : int
-    keys : list of str
+
+    Notes
+    -----
+    The dictionary is traversed depth-first with an explicit stack, so deeply nested process graphs do not hit the
+    recursion limit. Nodes are numbered in the order they are found.
+    While walking through the arguments of a node, the keys pointing to each 'from_node', 'from_parameter' and
+    embedded 'process_graph' are recorded relative to the arguments in `node.references` (see `REFERENCE_TYPES`).
 
     """
 
     process_defs = load_processes(process_defs)
 
-    if keys is None:
-        keys = []
+    # process graph dictionary keys pointing to the current dictionary or list
+    keys = []
+    # each stack entry holds an iterator over the items of a dictionary or list, the number of keys pointing to
+    # this dictionary or list, the closest node embedding it and the node if it is part of the node's arguments
+    if node is None:
+        stack = [(iter(process_graph.items()), 0, None, None)]
+    else:
+        node.references = {reference_type: [] for reference_type in REFERENCE_TYPES}
+        keys = list(node.keys) + ['arguments']
+        stack = [(iter(node.content['arguments'].items()), len(keys), node, node)]
+    while stack:
+        items, n_keys, parent_node, arg_node = stack[-1]
+        for key, value in items:
+            if arg_node is not None and key in REFERENCE_TYPES:
+                if key == "process_graph" and isinstance(value, dict):  # embedded process graph found
+                    arg_node.references[key].append(tuple(keys[len(arg_node.keys) + 1:n_keys]))
+                    del keys[n_keys:]
+                    keys.append(key)
+                    stack.append((iter(value.items()), n_keys + 1, arg_node, None))
+                    break
+                elif key != "process_graph" and not isinstance(value, (dict, list)):  # reference found
+                    arg_node.references[key].append(tuple(keys[len(arg_node.keys) + 1:n_keys]) + (key,))
+                    continue
+
+            if isinstance(value, dict):
+                sub_items = iter(value.items())
+            elif isinstance(value, list):
+                sub_items = enumerate(value)
+            else:
+                continue
 
-    for key, value in process_graph.items():
-        if isinstance(value, dict):
-            keys = copy.deepcopy(keys)
+            del keys[n_keys:]
             keys.append(key)
-            if "process_id" in value.keys():  # process node found
-                node_counter = len(nodes)
-                node_id = "_".join([key, str(node_counter)])
-                node = OpenEONode(id=node_id, name=key, content=value, edges=[], depth=level,
-                                  processes_src=process_defs)
-                node.keys = keys
-                if node_ids:
-                    filtered_node_ids = [prev_node_id for prev_node_id in node_ids if prev_node_id]
-                    parent_node_id = filtered_node_ids[-1]
-                    parent_node = nodes[parent_node_id]
+            if arg_node is None and isinstance(value, dict) and "process_id" in value.keys():  # process node found
+                node_id = "_".join([key, str(start_index + len(nodes))])
+                node = OpenEONode(id=node_id, name=key, content=value, edges=[], depth=n_keys,
+                                  processes_src=process_defs, keys=tuple(keys),
+                                  references={reference_type: [] for reference_type in REFERENCE_TYPES})
+                if parent_node is not None:
                     create_edge(node, parent_node, name="callback")
 
                     # overwrite depth using parent information
                     node.depth = parent_node.depth + 1
 
                 nodes[node_id] = node
-            else:
-                node_id = None
+                if scopes is not None:
+                    scopes.setdefault(get_scope_id(node, parent_node), OrderedDict()).setdefault(key, node)
 
-            if node_ids is None:
-                node_ids = []
-            node_ids.append(node_id)
-            level += 1
-            nodes, node_ids, level, keys = walk_process_graph(value, nodes, process_defs, node_ids=node_ids, level=level,
-                                                              keys=keys)
-
-    level += -1
-    if node_ids:
-        node_ids = node_ids[:-1]
-    if keys:
-        keys = keys[:-1]
+                arguments = value.get('arguments')
+                if isinstance(arguments, dict):
+                    keys.append('arguments')
+                    stack.append((iter(arguments.items()), n_keys + 2, node, node))
+            else:
+                stack.append((sub_items, n_keys + 1, parent_node, arg_node))
+            break
+        else:
+            stack.pop()
 
-    return nodes, node_ids, level, keys
+    return nodes
 
 
 def find_node_inputs(node, data_link):
@@ -101,10 +141,13 @@ def find_node_inputs(node, data_link):
 
     Returns
     -------
-    keys_lineage : list of lists
+    keys_lineage : list of lists or tuples
         Adjusted keys indexes/lineage to go from the sub process graph to input node ID.
     """
 
+    if node.references is not None:  # references were recorded while walking through the process graph
+        return node.references[data_link]
+
     keys_lineage = []
     for key, value in node.arguments.items():
         keys_lineage_arg, _, _, _ = walk_process_dictionary(value, break_points=["process_graph"])
@@ -114,7 +157,57 @@ def find_node_inputs(node, data_link):
     return keys_lineage
 
 
-def adjust_from_nodes(process_graph):
+def get_scope_id(node, parent_node):
+    """
+    Identifies the (embedded) process graph a node is part of (see `build_scopes`).
+
+    Parameters
+    ----------
+    node : graph.OpenEONode
+        Node of the process graph.
+    parent_node : graph.OpenEONode
+        Parent process node embedding the process graph or None for the top-level process graph.
+
+    Returns
+    -------
+    tuple :
+        ID of the parent process node and the keys pointing to the embedded process graph within its arguments (see
+        `OpenEONode.references`), or None for the top-level process graph.
+
+    """
+    if parent_node is None:
+        return None
+
+    # exclude "arguments" at the start and "process_graph" and the node name at the end
+    return parent_node.id, tuple(node.keys[len(parent_node.keys) + 1:-2])
+
+
+def build_scopes(process_graph):
+    """
+    Creates a name index for each (embedded) process graph, i.e. for each scope a node name can be resolved in.
+
+    Parameters
+    ----------
+    process_graph : graph.Graph
+        openEO process graph as a graph object.
+
+    Returns
+    -------
+    dict :
+        Dictionary with the scope ID's (see `get_scope_id`) as keys and ordered dictionaries linking the node names
+        with the nodes of this process graph as values. A process node can embed several process graphs, e.g. one
+        per property of 'load_collection', each having its own scope.
+
+    """
+    scopes = {}
+    for node in process_graph.nodes:
+        scope_id = get_scope_id(node, node.parent_process)
+        scopes.setdefault(scope_id, OrderedDict()).setdefault(node.name, node)
+
+    return scopes
+
+
+def adjust_from_nodes(process_graph, scopes=None):
     """
     Resets 'from_node' content with corresponding Node IDs.
 
@@ -122,6 +215,8 @@ def adjust_from_nodes(process_graph):
     ----------
     process_graph : graph.Graph
         openEO process graph as a graph object.
+    scopes : dict, optional
+        Name index of each process graph (see `build_scopes`). It is created if not given.
 
     Returns
     -------
@@ -129,14 +224,16 @@ def adjust_from_nodes(process_graph):
 
     """
 
+    scopes = build_scopes(process_graph) if scopes is None else scopes
+    node_scopes = {node.id: scope for scope in scopes.values() for node in scope.values()}
     for node in process_graph.nodes:
-        pg_same_level = process_graph.find_partners(node, link="callback", include_node=True)
+        pg_same_level = node_scopes[node.id]
         keys_lineage = find_node_inputs(node, "from_node")
         for key_lineage in keys_lineage:
             data_entry = get_obj_elem_from_keys(node.content['arguments'], key_lineage)
             if data_entry in process_graph.ids:  # data entry already exists as it was created during the recursive walk
                 continue
-            node_other = pg_same_level.get_node_by_name(data_entry)
+            node_other = pg_same_level.get(data_entry)
             if node_other:
                 set_obj_elem_from_keys(node.content['arguments'], key_lineage, node_other.id)
                 create_edge(node_other, node)
@@ -148,7 +245,8 @@ def adjust_from_nodes(process_graph):
 
 def create_edge(node_from, node_to, name="data", hidden=False):
     """
-    Creates a directed edge of type `graph.Edge` between the nodes `node_from` and `node_to`.
+    Creates a directed edge of type `graph.Edge` between the nodes `node_from` and `node_to` and adds it to both
+    nodes.
 
     Parameters
     ----------
@@ -174,7 +272,37 @@ def create_edge(node_from, node_to, name="data", hidden=False):
     node_from.add_edge(edge)
 
 
-def adjust_from_parameters(process_graph, parameters=None):
+def build_parameter_table(node):
+    """
+    Collects all parameters, which can be referenced by 'from_parameter' in the process graph embedded in the given
+    node. The precedence of parameters with the same name is: parameters of the sub-process, parameters of the
+    process (with their default values) and parameters defined at the same level.
+
+    Parameters
+    ----------
+    node : graph.OpenEONode
+        Node embedding a process graph.
+
+    Returns
+    -------
+    dict :
+        Dictionary linking the parameter names with a tuple. The tuple contains a flag, which is true for
+        sub-process parameters, and the parameter definition (`OpenEOParameter` instance).
+
+    """
+    parameter_table = {}
+    process = node.process
+    for parameter in process.sub_parameters.values():
+        parameter_table.setdefault(parameter.name, (True, parameter))
+    for parameter in process.parameters.values():
+        parameter_table.setdefault(parameter.name, (False, parameter))
+    for parameter in node.parameters:
+        parameter_table.setdefault(parameter.name, (False, parameter))
+
+    return parameter_table
+
+
+def adjust_from_parameters(process_graph, parameters=None, scopes=None, parent_nodes=None, slots=None):
     """"
     Resets 'from_parameter' content with corresponding Node IDs.
 
@@ -184,6 +312,15 @@ def adjust_from_parameters(process_graph, parameters=None):
         openEO process graph as a graph object.
     parameters : dict, optional
         Globally defined parameters, which can be used in 'from_parameter'.
+    scopes : dict, optional
+        Name index of each process graph (see `build_scopes`). It is created if not given.
+    parent_nodes : dict, optional
+        Dictionary linking node IDs with their parent process node (None for top-level nodes). It must contain all
+        nodes of the graph and their parent process nodes. If not given, it is derived from `scopes`.
+    slots : list, optional
+        If given, each reference to a globally defined parameter is appended as a tuple of the node ID, the keys
+        pointing to the reference within the node arguments and the parameter name. References to undefined global
+        parameters are set to None instead of raising an error.
 
     Returns
     -------
@@ -192,25 +329,43 @@ def adjust_from_parameters(process_graph, parameters=None):
     Notes
     -----
     Attention: after this routine, the graph is sorted by depth!
+    A 'from_parameter' reference is resolved by looking up the parameter tables (see `build_parameter_table`) of all
+    parent process nodes, starting from the embedding one, and finally the globally defined parameters.
 
     """
     parameters = {} if parameters is None else parameters
 
+    # parent process node of each node and the parameter table of each parent process node
+    if parent_nodes is None:
+        scopes = build_scopes(process_graph) if scopes is None else scopes
+        parent_nodes = {}
+        for scope_id, scope in scopes.items():
+            scope_node = None if scope_id is None else process_graph[scope_id[0]]
+            for node in scope.values():
+                parent_nodes[node.id] = scope_node
+    parameter_tables = {}
+
     # sort graph by depth to complete nodes at a lower level/depth first
     process_graph = process_graph.sort(by='depth')
     for node in process_graph.nodes:
         keys_lineage = find_node_inputs(node, "from_parameter")
         for key_lineage in keys_lineage:
             from_parameter_name = get_obj_elem_from_keys(node.content['arguments'], key_lineage)
-            # get all higher level process-graphs, starting from the embedded one
-            parent_nodes = process_graph.lineage(node, link="callback", ancestors=False, include_node=False)
+            # backtrace as long a parent process exists, starting from the embedding one
             parameter_found = False
-            for parent_node in parent_nodes:  # backtrace as long a parent process exists
-                process = parent_node.process
-                # First, check if parameter is contained in the parameters of the sub-process
-                sub_parameters = process.sub_parameters
-                if sub_parameters and from_parameter_name in sub_parameters.keys():
-                    parameter = process.sub_parameters[from_parameter_name]
+            parent_node = parent_nodes[node.id]
+            while parent_node is not None:
+                if parent_node.id not in parameter_tables.keys():
+                    parameter_tables[parent_node.id] = build_parameter_table(parent_node)
+                if from_parameter_name in parameter_tables[parent_node.id].keys():
+                    parameter_found = True
+                    break
+                parent_node = parent_nodes[parent_node.id]
+
+            if parameter_found:
+                is_sub_parameter, parameter = parameter_tables[parent_node.id][from_parameter_name]
+                # parameter is contained in the parameters of the sub-process
+                if is_sub_parameter:
                     node_relatives = parent_node.relatives(link="data", ancestor=True)
                     # parameter is required, but the start node has no input data -> take parent node as data reference
                     if parameter.is_required and not node_relatives:
@@ -230,28 +385,16 @@ def adjust_from_parameters(process_graph, parameters=None):
                     # parameter is not required -> take its default value
                     else:
                         set_obj_elem_from_keys(node.content['arguments'], key_lineage[:-1], parameter.default_value)
-                    parameter_found = True
-                # Second, check if parameter is contained in process (take the default values)
-                elif from_parameter_name in process.parameters.keys():
-                    parameter = process.parameters[from_parameter_name]
+                # parameter is contained in the process or defined at the same level -> take its default value
+                else:
                     set_obj_elem_from_keys(node.content['arguments'], key_lineage[:-1], parameter.default_value)
-                    parameter_found = True
-                # Third, check if parameter is contained in parameter definition at the same level
-                elif parent_node.parameters:
-                    for parameter in parent_node.parameters:
-                        if from_parameter_name == parameter.name:
-                            set_obj_elem_from_keys(node.content['arguments'], key_lineage[:-1], parameter.default_value)
-                            parameter_found = True
-                            break
-
-                if parameter_found:
-                    break
-
             # if the parameter name is still not available, try to look into the globally defined parameters
-            if not parameter_found:
-                if from_parameter_name in parameters.keys():
-                    parameter_found = True
-                    set_obj_elem_from_keys(node.content['arguments'], key_lineage[:-1], parameters[from_parameter_name])
+            elif from_parameter_name in parameters.keys() or slots is not None:
+                parameter_found = True
+                set_obj_elem_from_keys(node.content['arguments'], key_lineage[:-1],
+                                       parameters.get(from_parameter_name))
+                if slots is not None:
+                    slots.append((node.id, tuple(key_lineage[:-1]), from_parameter_name))
 
             # parameter seems not to be available, raise an error
             if not parameter_found:
@@ -286,7 +429,71 @@ def adjust_callbacks(process_graph):
     return process_graph
 
 
-def link_nodes(process_graph, parameters=None):
+def detach_node_content(node):
+    """
+    Replaces the content of a node by a copy, which can be modified without changing the original process graph
+    dictionary. Only the dictionaries and lists on the way to a reference (see `OpenEONode.references`) are copied,
+    all other arguments are shared with the original content.
+
+    Parameters
+    ----------
+    node : graph.OpenEONode
+        Node created by `walk_process_graph`.
+
+    Returns
+    -------
+    graph.OpenEONode
+
+    """
+    node.content = dict(node.content)
+    arguments = dict(node.content['arguments'])
+    node.content['arguments'] = arguments
+
+    copied = {id(arguments)}  # identities of the dictionaries and lists already copied
+    for keys in [keys for references in node.references.values() for keys in references]:
+        obj = arguments
+        for key in keys[:-1]:
+            sub_obj = obj[key]
+            if not isinstance(sub_obj, (dict, list)):  # reference was already resolved
+                break
+            if id(sub_obj) not in copied:
+                sub_obj = dict(sub_obj) if isinstance(sub_obj, dict) else list(sub_obj)
+                copied.add(id(sub_obj))
+                obj[key] = sub_obj
+            obj = sub_obj
+
+    return node
+
+
+def copy_translation(process_graph):
+    """
+    Copies a translated openEO process graph cheaply. The nodes and edges are copied, but of the node contents only
+    the dictionaries and lists on the way to references are copied (see `detach_node_content`), i.e. the copy can be
+    edited (see `ProcessGraphEditor`) and bound (see `CompiledProcessGraph`) without changing the original graph.
+
+    Parameters
+    ----------
+    process_graph : graph.Graph
+        Translated openEO process graph.
+
+    Returns
+    -------
+    graph.Graph
+
+    Notes
+    -----
+    Literal arguments without references (e.g. geometries) are shared with the original graph, so they must be
+    replaced instead of being modified in place.
+
+    """
+    process_graph = process_graph.copy(copy_contents=False)
+    for node in process_graph.nodes:
+        detach_node_content(node)
+
+    return process_graph
+
+
+def link_nodes(process_graph, parameters=None, scopes=None, slots=None):
     """
     Links all nodes in the graph, i.e. links 'from_node', 'from_argument' and 'callback' with the corresponding
     Node IDs.
@@ -298,6 +505,10 @@ def link_nodes(process_graph, parameters=None):
         Process graph to connect the nodes within.
     parameters : dict, optional
         Globally defined parameters, which can be used in 'from_parameter'.
+    scopes : dict, optional
+        Name index of each process graph (see `build_scopes`).
+    slots : list, optional
+        If given, it is filled with all references to globally defined parameters (see `adjust_from_parameters`).
 
     Returns
     -------
@@ -305,17 +516,11 @@ def link_nodes(process_graph, parameters=None):
 
     """
 
-    # fill in all from_node parameters and create edges
-    process_graph = adjust_from_nodes(process_graph)
-
-    # update the edges of the graph
-    process_graph.update()
+    # fill in all from_node parameters and create edges (on both nodes)
+    process_graph = adjust_from_nodes(process_graph, scopes=scopes)
 
     # fill in all from_argument parameters
-    process_graph = adjust_from_parameters(process_graph, parameters=parameters)
-
-    # update the edges of the graph
-    process_graph.update()
+    process_graph = adjust_from_parameters(process_graph, parameters=parameters, scopes=scopes, slots=slots)
 
     # replace all embedded process graphs with the respective node IDs
     process_graph = adjust_callbacks(process_graph)
@@ -323,14 +528,338 @@ def link_nodes(process_graph, parameters=None):
     return process_graph
 
 
-def translate_process_graph(pg_filepath, process_defs=None, parameters=None):
+class ProcessGraphEditor:
+    """
+    Edits a translated openEO process graph node by node, i.e. only the edges, name indexes and parameter bindings
+    affected by an edit are updated instead of translating the whole process graph again.
+    """
+
+    def __init__(self, process_graph, process_defs=None, parameters=None):
+        """
+        Constructor of `ProcessGraphEditor` class.
+
+        Parameters
+        ----------
+        process_graph : graph.Graph
+            Translated openEO process graph (see `translate_process_graph`), which is modified by the editor.
+        process_defs : dict or str or list, optional
+            Process definitions (see `translate_process_graph`). The default value points to the "processes"
+            repository of the parser.
+        parameters : dict, optional
+            Globally defined parameters, which can be used in 'from_parameter', including the default values of the
+            parameters defined in the process graph.
+
+        """
+        process_defs = os.path.join(os.path.dirname(__file__), "processes") \
+            if process_defs is None else process_defs
+        self.process_graph = process_graph
+        self.process_defs = load_processes(process_defs)
+        self.parameters = {} if parameters is None else dict(parameters)
+        self.scopes = build_scopes(process_graph)
+        self.parent_nodes = {node.id: (None if scope_id is None else process_graph[scope_id[0]])
+                             for scope_id, scope in self.scopes.items() for node in scope.values()}
+
+        # new nodes are numbered after all existing ones
+        node_indexes = [int(node_id.rsplit("_", 1)[-1]) for node_id in process_graph.ids
+                        if node_id.rsplit("_", 1)[-1].isdigit()]
+        self.n_nodes = max(node_indexes) + 1 if node_indexes else len(process_graph)
+
+    def insert_node(self, name, content, parent_id=None, pg_keys=None):
+        """
+        Inserts a new node into the top-level process graph or into an embedded process graph.
+
+        Parameters
+        ----------
+        name : str
+            Name of the node, which must be unique within its process graph.
+        content : dict
+            Content of the node in openEO syntax, i.e. with 'from_node' references to node names, 'from_parameter'
+            references and embedded process graphs. The dictionary is modified while linking the node.
+        parent_id : str, optional
+            ID of the parent process node, if the node is part of an embedded process graph.
+        pg_keys : tuple, optional
+            Keys pointing to the embedded process graph within the arguments of the parent process node, e.g.
+            ('reducer',) (see `OpenEONode.references`). It is only needed if the parent process node embeds several
+            process graphs.
+
+        Returns
+        -------
+        graph.OpenEONode
+            Inserted node.
+
+        """
+        scope_id = None
+        if parent_id is not None:
+            parent_node = self.process_graph[parent_id]
+            pg_keys_all = parent_node.references['process_graph']
+            if pg_keys is None and len(pg_keys_all) == 1:
+                pg_keys = pg_keys_all[0]
+            elif pg_keys is None or tuple(pg_keys) not in pg_keys_all:
+                err_msg = "Node '{}' does not have a unique embedded process graph at {}, use one of {}.".format(
+                    parent_id, pg_keys, pg_keys_all)
+                raise ValueError(err_msg)
+            scope_id = (parent_id, tuple(pg_keys))
+
+        scope = self.scopes.get(scope_id, OrderedDict())
+        if name in scope.keys():
+            err_msg = "Node name '{}' is already used in the same process graph.".format(name)
+            raise ValueError(err_msg)
+
+        nodes = self._walk({name: content})
+        node = next(iter(nodes.values()))
+        if parent_id is not None:
+            # keys and depth of the new nodes are relative to the embedded process graph
+            for node_new in nodes.values():
+                node_new.keys = parent_node.keys + ('arguments',) + scope_id[1] + ('process_graph',) + node_new.keys
+                node_new.depth += parent_node.depth + 1
+            create_edge(node, parent_node, name="callback")
+
+        self.scopes[scope_id] = scope
+        scope[name] = node
+        self.parent_nodes[node.id] = None if parent_id is None else self.process_graph[parent_id]
+        self._link(nodes)
+
+        return node
+
+    def update_node_arguments(self, node_id, arguments):
+        """
+        Replaces the arguments of a node. All incoming data edges and embedded process graphs of the node are
+        replaced, the node keeps its ID.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node.
+        arguments : dict
+            New arguments in openEO syntax (see `insert_node`). The dictionary is modified while linking the node.
+
+        Returns
+        -------
+        graph.OpenEONode
+            Updated node.
+
+        """
+        node = self.process_graph[node_id]
+        for child_node in list(node.child_processes.nodes):
+            self._remove(child_node)
+        self._remove_scopes(node)
+        for edge in list(node.edges):
+            if edge.name == "data" and edge.nodes[1] is node:
+                node.remove_edge(edge)
+                edge.nodes[0].remove_edge(edge)
+
+        node.content = dict(node.content)
+        node.content['arguments'] = arguments
+        nodes = self._walk(None, node=node)
+        self._link(OrderedDict([(node.id, node)] + list(nodes.items())))
+
+        return node
+
+    def remove_node(self, node_id):
+        """
+        Removes a node and its embedded process graphs.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node.
+
+        Returns
+        -------
+        graph.OpenEONode
+            Removed node.
+
+        Notes
+        -----
+        A node can only be removed if no other node depends on it.
+
+        """
+        node = self.process_graph[node_id]
+        # nodes of the embedded process graphs are removed as well
+        subgraph_ids = set()
+        subgraph_nodes = [node]
+        while subgraph_nodes:
+            subgraph_node = subgraph_nodes.pop()
+            subgraph_ids.add(subgraph_node.id)
+            subgraph_nodes.extend(subgraph_node.child_processes.nodes)
+
+        dependent_ids = [edge.nodes[1].id for subgraph_id in subgraph_ids
+                         for edge in self.process_graph[subgraph_id].edges
+                         if edge.name == "data" and edge.nodes[0].id == subgraph_id
+                         and edge.nodes[1].id not in subgraph_ids]
+        if node.is_result and self.parent_nodes[node.id] is not None:
+            dependent_ids.append(self.parent_nodes[node.id].id)
+        if dependent_ids:
+            err_msg = "Node '{}' cannot be removed, because the nodes {} depend on it.".format(node_id, dependent_ids)
+            raise ValueError(err_msg)
+
+        self._remove(node)
+
+        return node
+
+    def _walk(self, process_graph, node=None):
+        """ Walks through new content (see `walk_process_graph`) and registers the new nodes and their scopes. """
+        nodes = OrderedDict()
+        scopes = {}
+        walk_process_graph(process_graph, nodes, self.process_defs, scopes=scopes, node=node,
+                           start_index=self.n_nodes)
+        self.n_nodes += len(nodes)
+
+        for node_new in nodes.values():
+            self.process_graph.add_node(node_new)
+        for scope_id, scope in scopes.items():
+            if scope_id is not None:
+                self.scopes[scope_id] = scope
+                for node_new in scope.values():
+                    self.parent_nodes[node_new.id] = self.process_graph[scope_id[0]]
+
+        return nodes
+
+    def _link(self, nodes):
+        """ Links new or updated nodes (see `link_nodes`). """
+        graph = Graph(nodes)
+        scope_ids = {get_scope_id(node, self.parent_nodes[node_id]) for node_id, node in nodes.items()}
+        adjust_from_nodes(graph, scopes={scope_id: self.scopes[scope_id] for scope_id in scope_ids})
+        adjust_from_parameters(graph, parameters=self.parameters, parent_nodes=self.parent_nodes)
+        adjust_callbacks(graph)
+
+    def _remove(self, node):
+        """ Removes a node and its embedded process graphs from the graph and all name indexes. """
+        for child_node in list(node.child_processes.nodes):
+            self._remove(child_node)
+
+        parent_node = self.parent_nodes.pop(node.id)
+        scope = self.scopes[get_scope_id(node, parent_node)]
+        if scope.get(node.name) is node:
+            del scope[node.name]
+        self._remove_scopes(node)
+        self.process_graph.remove_node(node.id)
+
+    def _remove_scopes(self, node):
+        """ Removes the name indexes of all process graphs embedded in a node. """
+        scope_ids = [scope_id for scope_id in self.scopes.keys() if scope_id is not None and scope_id[0] == node.id]
+        for scope_id in scope_ids:
+            del self.scopes[scope_id]
+
+
+def load_process_graph(pg_filepath, stream=False, min_raw_size=None):
+    """
+    Loads an openEO process graph from a file or a JSON document.
+
+    Parameters
+    ----------
+    pg_filepath : str or bytes or dict
+        openEO process graph given as full file path, JSON document (bytes) or a stacked dictionary.
+    stream : bool, optional
+        If true, large arguments without references are kept as raw JSON (see `translate_process_graph`).
+    min_raw_size : int, optional
+        Minimum size of arguments kept as raw JSON if `stream` is true (defaults to `lazyjson.MIN_RAW_SIZE`).
+
+    Returns
+    -------
+    dict
+
+    """
+    if isinstance(pg_filepath, str):
+        return lazyjson.load(pg_filepath, min_raw_size=min_raw_size) if stream else load_json_file(pg_filepath)
+    elif isinstance(pg_filepath, (bytes, bytearray, memoryview)):
+        return lazyjson.loads(pg_filepath, min_raw_size=min_raw_size) if stream else jsonio.loads(pg_filepath)
+    elif isinstance(pg_filepath, dict):
+        return pg_filepath
+    else:
+        raise ValueError("'pg_filepath must either be file path to a JSON file, a JSON document or a dictionary.'")
+
+
+def process_graph_hash(process_graph, process_defs, parameters=None):
+    """
+    Computes a hash of a process graph, the global parameters and the state of the process definitions, which is
+    independent of the formatting of the process graph. The key order is kept, because the node ID's are assigned in
+    the order of the process graph.
+
+    Parameters
+    ----------
+    process_graph : dict
+        openEO process graph as a stacked dictionary.
+    process_defs : dict or str or list
+        Process definitions (see `translate_process_graph` and `process_catalog_key`).
+    parameters : dict, optional
+        Globally defined parameters, which can be used in 'from_parameter'.
+
+    Returns
+    -------
+    str
+
+    """
+    document = jsonio.dumps([process_graph, parameters, process_catalog_key(process_defs)], default=hash_default)
+
+    return hashlib.sha256(document).hexdigest()
+
+
+def process_catalog_key(process_defs):
+    """
+    Creates a key identifying process definitions and their current state.
+
+    Parameters
+    ----------
+    process_defs : dict or str or list
+        Process definitions (see `translate_process_graph`). Sources given as paths or URLs and lazy process catalogs
+        are identified by the state of their source (see `utils.process_source_key`), loaded process definitions by
+        a hash of their content.
+
+    Returns
+    -------
+    tuple
+
+    Notes
+    -----
+    The hash of loaded process definitions is computed once per object (see `CATALOG_KEYS`), i.e. like the ones
+    returned by `utils.load_processes`, they must not be modified in place.
+
+    """
+    if isinstance(process_defs, str):
+        return process_source_key(process_defs)
+    elif isinstance(process_defs, LazyProcessCatalog):
+        return ("lazy", process_defs.runtime) + process_source_key(process_defs.dirpath)
+
+    entry = CATALOG_KEYS.get(id(process_defs))
+    if entry is None or entry[0] is not process_defs:
+        document = jsonio.dumps(process_defs, sort_keys=True, default=repr)
+        entry = (process_defs, ("content", hashlib.sha256(document).hexdigest()))
+        CATALOG_KEYS.set(id(process_defs), entry)
+
+    return entry[1]
+
+
+def hash_default(obj):
+    """
+    Converts objects, which are not serializable as JSON, for hashing (see `process_graph_hash`). Raw JSON is
+    represented by its text, so it does not need to be parsed.
+
+    Parameters
+    ----------
+    obj : object
+        Object to convert.
+
+    Returns
+    -------
+    dict or str
+
+    """
+    if isinstance(obj, lazyjson.RawJSON):
+        return {"__raw_json__": obj.raw.decode("utf-8")}
+
+    return repr(obj)
+
+
+def translate_process_graph(pg_filepath, process_defs=None, parameters=None, inplace=True, stream=False,
+                            use_cache=False, slots=None, min_raw_size=None):
     """
     Translates an openEO process graph into a graph.Graph object.
 
     Parameters
     ----------
-    pg_filepath : str or dict
-        openEO process graph given as full file path or a stacked dictionary.
+    pg_filepath : str or bytes or dict
+        openEO process graph given as full file path, JSON document (bytes) or a stacked dictionary.
     process_defs : dict or str or list, optional
         It can be:
             - dictionary of loaded process definitions (keys are the process ID's)
@@ -340,6 +869,24 @@ def translate_process_graph(pg_filepath, process_defs=None, parameters=None):
         The default value points to the "processes" repository of the parser.
     parameters : dict, optional
         Globally defined parameters, which can be used in 'from_parameter'.
+    inplace : bool, optional
+        If false, a process graph given as a dictionary is not modified. The node contents are copies sharing all
+        arguments with the given dictionary, except the (resolved) references (default is True).
+    stream : bool, optional
+        If true, large arguments without references (e.g., geometries) of a process graph given as a file path or
+        bytes are not parsed, but kept as `lazyjson.RawJSON` instances until their value is requested
+        (default is False).
+    min_raw_size : int, optional
+        Minimum size of arguments kept as raw JSON in bytes if `stream` is true (defaults to
+        `lazyjson.MIN_RAW_SIZE`).
+    use_cache : bool, optional
+        If true, the translation is taken from `TRANSLATION_CACHE` if the same process graph was translated before
+        with the same parameters and process definitions. A cheap copy of the cached graph is returned (see
+        `copy_translation`), which can be edited and bound, but shares literal arguments with the cache. A process
+        graph given as a dictionary is never modified in this case, independent of `inplace` (default is False).
+    slots : list, optional
+        If given, it is filled with all references to globally defined parameters and the translation does not fail
+        for undefined ones (see `adjust_from_parameters`). The cache is not used in this case.
 
     Returns
     -------
@@ -348,19 +895,29 @@ def translate_process_graph(pg_filepath, process_defs=None, parameters=None):
 
     """
 
-    if isinstance(pg_filepath, str):
-        process_graph = load_json_file(pg_filepath)
-    elif isinstance(pg_filepath, dict):
-        process_graph = pg_filepath
-    else:
-        raise ValueError("'pg_filepath must either be file path to a JSON file or a dictionary.'")
+    # define source of process definitions
+    process_defs = os.path.join(os.path.dirname(__file__), "processes") \
+        if process_defs is None else process_defs
 
-    # remove first layer of the process graph
-    parameters = {} if parameters is None else parameters
-    if "parameters" in process_graph.keys():
-        for parameter_def in process_graph['parameters']:
-            parameter = OpenEOParameter(parameter_def)
-            parameters.update({parameter.name: parameter.default_value})
+    process_graph = load_process_graph(pg_filepath, stream=stream, min_raw_size=min_raw_size)
+    if use_cache and slots is None:
+        key = process_graph_hash(process_graph, process_defs, parameters=parameters)
+        graph = TRANSLATION_CACHE.get(key)
+        if graph is not None:
+            return copy_translation(graph)
+
+        # a given dictionary is never modified, so a cache hit and miss behave the same
+        graph = translate_process_graph(process_graph, process_defs=process_defs, parameters=parameters,
+                                        inplace=process_graph is not pg_filepath)
+        TRANSLATION_CACHE.set(key, graph.copy())
+        return graph
+
+    detach = not inplace and isinstance(pg_filepath, dict)
+
+    # remove first layer of the process graph; the default values of its parameters are used if not given
+    parameters = {} if parameters is None else dict(parameters)
+    for name, default_value in get_parameter_defaults(process_graph).items():
+        parameters.setdefault(name, default_value)
 
     if "process_graph" in process_graph.keys():
         process_graph = process_graph['process_graph']
@@ -369,22 +926,339 @@ def translate_process_graph(pg_filepath, process_defs=None, parameters=None):
                   "Processes need to be declared/wrapped inside 'process_graph' layer."
         raise Exception(err_msg)
 
-    # define source of process definitions
-    process_defs = os.path.join(os.path.dirname(__file__), "processes") \
-        if process_defs is None else process_defs
+    process_defs = load_processes(process_defs)
 
     # traverse process graph
     nodes = OrderedDict()
-    nodes, _, _, _ = walk_process_graph(process_graph, nodes, process_defs)
+    scopes = {}
+    nodes = walk_process_graph(process_graph, nodes, process_defs, scopes=scopes)
+    if detach:
+        for node in nodes.values():
+            detach_node_content(node)
 
     # create graph object
     process_graph = Graph(nodes)
 
     # link all nodes and fill in from_node and from_argument
-    process_graph = link_nodes(process_graph, parameters=parameters)
+    process_graph = link_nodes(process_graph, parameters=parameters, scopes=scopes, slots=slots)
 
     return process_graph
 
 
+def get_parameter_defaults(process_graph):
+    """
+    Returns the default values of the parameters defined in the first layer of a process graph.
+
+    Parameters
+    ----------
+    process_graph : dict
+        openEO process graph as a stacked dictionary.
+
+    Returns
+    -------
+    dict :
+        Dictionary linking the parameter names with their default values.
+
+    """
+    parameter_defaults = {}
+    for parameter_def in process_graph.get('parameters', []):
+        parameter = OpenEOParameter(parameter_def)
+        parameter_defaults[parameter.name] = parameter.default_value
+
+    return parameter_defaults
+
+
+class CompiledProcessGraph:
+    """
+    Translated openEO process graph, whose references to globally defined parameters are kept as slots, which can be
+    bound to different parameter values without translating the process graph again.
+    """
+
+    def __init__(self, process_graph, slots, parameter_defaults=None):
+        """
+        Constructor of `CompiledProcessGraph` class.
+
+        Parameters
+        ----------
+        process_graph : graph.Graph
+            Translated openEO process graph.
+        slots : list of tuple
+            References to globally defined parameters (see `adjust_from_parameters`).
+        parameter_defaults : dict, optional
+            Default values of the parameters defined in the process graph (see `get_parameter_defaults`).
+
+        """
+        self.process_graph = process_graph
+        self.slots = slots
+        self.parameter_defaults = {} if parameter_defaults is None else parameter_defaults
+
+    @property
+    def parameter_names(self):
+        """ set : Names of all globally defined parameters referenced in the process graph. """
+        return {name for _, _, name in self.slots}
+
+    def bind(self, parameters=None, copy=False):
+        """
+        Fills in the given parameter values at all slots.
+
+        Parameters
+        ----------
+        parameters : dict, optional
+            Globally defined parameters, which can be used in 'from_parameter'. Parameters defined in the process
+            graph take their default value if not given.
+        copy : bool, optional
+            If true, the values are filled into a copy of the compiled graph (see `Graph.copy`). Otherwise, the
+            compiled graph itself is filled and returned, i.e. the values of a former binding are overwritten
+            (default is False).
+
+        Returns
+        -------
+        graph.Graph
+
+        """
+        parameters = {} if parameters is None else parameters
+        missing_names = self.parameter_names - set(parameters.keys()) - set(self.parameter_defaults.keys())
+        if missing_names:
+            err_msg = "'from_parameter' reference name '{}' " \
+                      "can't be found or is not defined.".format(sorted(missing_names)[0])
+            raise ValueError(err_msg)
+
+        process_graph = self.process_graph.copy() if copy else self.process_graph
+        for node_id, keys, name in self.slots:
+            value = parameters[name] if name in parameters.keys() else self.parameter_defaults[name]
+            set_obj_elem_from_keys(process_graph[node_id].content['arguments'], keys, value)
+
+        return process_graph
+
+
+def compile_process_graph(pg_filepath, process_defs=None, inplace=True, stream=False, min_raw_size=None):
+    """
+    Translates an openEO process graph without binding globally defined parameters (see `CompiledProcessGraph`).
+
+    Parameters
+    ----------
+    pg_filepath : str or bytes or dict
+        openEO process graph given as full file path, JSON document (bytes) or a stacked dictionary.
+    process_defs : dict or str or list, optional
+        Process definitions (see `translate_process_graph`). The default value points to the "processes" repository
+        of the parser.
+    inplace : bool, optional
+        If false, a process graph given as a dictionary is not modified (see `translate_process_graph`).
+    stream : bool, optional
+        If true, large arguments without references are kept as raw JSON (see `translate_process_graph`).
+    min_raw_size : int, optional
+        Minimum size of arguments kept as raw JSON if `stream` is true (defaults to `lazyjson.MIN_RAW_SIZE`).
+
+    Returns
+    -------
+    CompiledProcessGraph
+
+    """
+    process_graph = load_process_graph(pg_filepath, stream=stream, min_raw_size=min_raw_size)
+    slots = []
+    inplace = inplace or process_graph is not pg_filepath
+    graph = translate_process_graph(process_graph, process_defs=process_defs, inplace=inplace, slots=slots)
+
+    return CompiledProcessGraph(graph, slots, parameter_defaults=get_parameter_defaults(process_graph))
+
+
+def init_translation_worker(process_defs):
+    """
+    Loads the process definitions once per worker process of `translate_process_graphs`.
+
+    Parameters
+    ----------
+    process_defs : dict or str or list
+        Process definitions (see `translate_process_graph`).
+
+    """
+    global WORKER_PROCESS_DEFS
+    WORKER_PROCESS_DEFS = load_processes(process_defs)
+
+
+def translate_in_worker(index, pg_filepath, parameters=None, stream=False, process_defs=None):
+    """
+    Translates one process graph with the given process definitions or the ones of the worker (see
+    `init_translation_worker`).
+
+    Parameters
+    ----------
+    index : int
+        Position of the process graph in the batch.
+    pg_filepath : str or bytes or dict
+        openEO process graph (see `translate_process_graph`).
+    parameters : dict, optional
+        Globally defined parameters, which can be used in 'from_parameter'.
+    stream : bool, optional
+        If true, large arguments without references are kept as raw JSON (see `translate_process_graph`).
+    process_defs : dict, optional
+        Loaded process definitions (defaults to the ones loaded by `init_translation_worker`).
+
+    Returns
+    -------
+    index : int
+        Position of the process graph in the batch.
+    graph.Graph
+        Parsed openEO process graph or None if the translation failed.
+    Exception
+        Error raised by the translation or None.
+
+    """
+    try:
+        process_defs = WORKER_PROCESS_DEFS if process_defs is None else process_defs
+        graph = translate_process_graph(pg_filepath, process_defs=process_defs, parameters=parameters,
+                                        stream=stream)
+    except Exception as e:
+        return index, None, e
+
+    return index, graph, None
+
+
+def translate_process_graphs(pg_filepaths, process_defs=None, parameters=None, max_workers=None, ordered=True,
+                             stream=False):
+    """
+    Translates several openEO process graphs in a pool of worker processes, each loading the process definitions only
+    once.
+
+    Parameters
+    ----------
+    pg_filepaths : iterable
+        openEO process graphs given as full file paths, JSON documents (bytes) or stacked dictionaries. The iterable
+        is consumed lazily.
+    process_defs : dict or str or list, optional
+        Process definitions (see `translate_process_graph`). The default value points to the "processes" repository
+        of the parser.
+    parameters : dict, optional
+        Globally defined parameters, which can be used in 'from_parameter' of every process graph.
+    max_workers : int, optional
+        Number of worker processes (defaults to the number of processors). If 1, the process graphs are translated
+        in the calling process.
+    ordered : bool, optional
+        If true, the results are yielded in the order of `pg_filepaths`, otherwise in the order of completion
+        (default is True).
+    stream : bool, optional
+        If true, large arguments without references are kept as raw JSON (see `translate_process_graph`).
+
+    Yields
+    ------
+    index : int
+        Position of the process graph in `pg_filepaths`.
+    graph.Graph
+        Parsed openEO process graph or None if the translation failed.
+    Exception
+        Error raised by the translation or returning its result, or None.
+
+    Notes
+    -----
+    At most twice as many process graphs as there are workers are submitted at once, i.e. the memory usage does not
+    depend on the size of the batch. Each worker loads the process definitions once when it is started, while the
+    calling process only loads them if the process graphs are translated in it (`max_workers` is 1).
+    Errors of returning a translation from a worker (e.g. pickling errors or a worker dying) are yielded as the error
+    of the respective process graph as well. If a worker dies, the remaining process graphs are translated in a new
+    pool.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    process_defs = os.path.join(os.path.dirname(__file__), "processes") \
+        if process_defs is None else process_defs
+    max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    pg_filepaths = enumerate(pg_filepaths)
+
+    if max_workers == 1:
+        process_defs = load_processes(process_defs)
+        for index, pg_filepath in pg_filepaths:
+            yield translate_in_worker(index, pg_filepath, parameters=parameters, stream=stream,
+                                      process_defs=process_defs)
+        return
+
+    def create_executor():
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=init_translation_worker,
+                                   initargs=(process_defs,))
+
+    executor = create_executor()
+    futures = []
+    try:
+        for index, pg_filepath in pg_filepaths:
+            try:
+                future = executor.submit(translate_in_worker, index, pg_filepath, parameters, stream)
+            except BrokenProcessPool:  # a worker died, the remaining process graphs are translated in a new pool
+                executor.shutdown(wait=False)
+                executor = create_executor()
+                future = executor.submit(translate_in_worker, index, pg_filepath, parameters, stream)
+            futures.append((index, future))
+            while len(futures) >= 2 * max_workers:
+                futures, results = collect_translations(futures, ordered)
+                yield from results
+
+        while futures:
+            futures, results = collect_translations(futures, ordered)
+            yield from results
+    finally:
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def collect_translations(futures, ordered):
+    """
+    Waits for pending translations of `translate_process_graphs` and collects the finished ones.
+
+    Parameters
+    ----------
+    futures : list of tuple
+        Positions of the process graphs in the batch and their pending translations (`concurrent.futures.Future`) in
+        the order of submission.
+    ordered : bool
+        If true, only the first translation and its finished successors are collected.
+
+    Returns
+    -------
+    futures : list of tuple
+        Remaining pending translations.
+    results : list of tuple
+        Results of the collected translations (see `translate_in_worker`).
+
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    if ordered:
+        wait([futures[0][1]])
+        n_done = 0
+        while n_done < len(futures) and futures[n_done][1].done():
+            n_done += 1
+        results = [get_translation(index, future) for index, future in futures[:n_done]]
+        return futures[n_done:], results
+
+    done, _ = wait([future for _, future in futures], return_when=FIRST_COMPLETED)
+    results = [get_translation(index, future) for index, future in futures if future in done]
+    return [(index, future) for index, future in futures if future not in done], results
+
+
+def get_translation(index, future):
+    """
+    Returns the result of a finished translation of `translate_process_graphs`. Errors, which are raised outside of
+    the translation itself (e.g. while sending the result back or if the worker died), are returned as the error of
+    this process graph.
+
+    Parameters
+    ----------
+    index : int
+        Position of the process graph in the batch.
+    future : concurrent.futures.Future
+        Finished translation.
+
+    Returns
+    -------
+    tuple
+        Result of the translation (see `translate_in_worker`).
+
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return index, None, e
+
 if __name__ == '__main__':
     pass
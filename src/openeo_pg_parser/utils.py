@@ -1,7 +1,172 @@
 import os
 import glob
-import requests
-from json import load
+import pickle
+from collections.abc import Mapping
+from openeo_pg_parser.remote import is_url
+from openeo_pg_parser import jsonio
+from openeo_pg_parser.remote import fetch_json
+from openeo_pg_parser.remote import get_session
+
+
+# registry of already loaded process definitions, keyed by the source and its state (see `process_source_key`)
+PROCESS_REGISTRY = {}
+
+# header of a precompiled process catalog file (see `compile_process_catalog`)
+CATALOG_HEADER = b"OPENEO-PG-PARSER-CATALOG"
+CATALOG_VERSION = 1
+
+# fields of a process definition kept in a runtime catalog (see `trim_process_definition`)
+RUNTIME_PROCESS_FIELDS = ('id', 'categories', 'parameters', 'returns', 'process_graph', 'deprecated', 'experimental')
+
+
+class RuntimeProcessDefinition(dict):
+    """
+    Process definition without its documentation (descriptions, examples, links, exceptions, ...). The full
+    definition is loaded from the original source when it is requested.
+    """
+
+    def __init__(self, process_def, source=None):
+        """
+        Constructor of `RuntimeProcessDefinition` class.
+
+        Parameters
+        ----------
+        process_def : dict
+            Trimmed process definition.
+        source : str, optional
+            Directory path, catalog file path or URL the full process definition can be loaded from.
+
+        """
+        super().__init__(process_def)
+        self.source = source
+
+    @property
+    def full_definition(self):
+        """ dict : Full process definition including its documentation. """
+        if self.source is None:
+            return self
+
+        return load_processes(self.source, lazy=True)[self['id']]
+
+
+def trim_schema(schema):
+    """
+    Removes documentation (descriptions and examples) from a parameter or return value schema.
+
+    Parameters
+    ----------
+    schema : dict or list or object
+        Parameter or return value definition/schema.
+
+    Returns
+    -------
+    dict or list or object
+        Schema without documentation.
+
+    """
+    if isinstance(schema, dict):
+        # 'description' or 'examples' with other types are property names of an object schema
+        return {key: trim_schema(value) for key, value in schema.items()
+                if not (key == 'description' and isinstance(value, str)) and
+                not (key == 'examples' and isinstance(value, list))}
+    elif isinstance(schema, list):
+        return [trim_schema(elem) for elem in schema]
+    else:
+        return schema
+
+
+def trim_process_definition(process_def, source=None):
+    """
+    Creates a runtime version of a process definition, i.e. only the fields listed in `RUNTIME_PROCESS_FIELDS`
+    are kept and the documentation is removed from the parameter and return value schemas.
+
+    Parameters
+    ----------
+    process_def : dict
+        A dictionary defining an openEO process definition/schema.
+    source : str, optional
+        Directory path, catalog file path or URL the full process definition can be loaded from.
+
+    Returns
+    -------
+    RuntimeProcessDefinition
+
+    """
+    runtime_def = {}
+    for field in RUNTIME_PROCESS_FIELDS:
+        if field in process_def.keys():
+            value = process_def[field]
+            runtime_def[field] = trim_schema(value) if field in ['parameters', 'returns'] else value
+
+    return RuntimeProcessDefinition(runtime_def, source=source)
+
+
+class LazyProcessCatalog(Mapping):
+    """
+    Read-only mapping of process IDs to process definitions of a process directory. The process IDs are taken from
+    the file names and a process definition (JSON) file is only parsed when its process ID is accessed for the first
+    time.
+    """
+
+    def __init__(self, dirpath, runtime=False):
+        """
+        Constructor of `LazyProcessCatalog` class.
+
+        Parameters
+        ----------
+        dirpath : str
+            Directory path to processes (.json).
+        runtime : bool, optional
+            If true, process definitions are loaded without their documentation (see `trim_process_definition`).
+
+        """
+        self.dirpath = dirpath
+        self.runtime = runtime
+        self._filepaths = {}
+        for filepath in glob.glob(os.path.join(dirpath, "*.json")):
+            process_id = os.path.splitext(os.path.basename(filepath))[0]
+            self._filepaths[process_id] = filepath
+        self._processes = {}
+
+    @property
+    def loaded_ids(self):
+        """ list : ID's of the processes, which are already loaded. """
+        return list(self._processes.keys())
+
+    def __getitem__(self, process_id):
+        """
+        Returns the process definition of the given process ID and loads it if necessary.
+
+        Parameters
+        ----------
+        process_id : str
+            ID of the process.
+
+        Returns
+        -------
+        dict
+
+        """
+        process = self._processes.get(process_id)
+        if process is None:
+            process = load_json_file(self._filepaths[process_id])
+            if self.runtime:
+                process = trim_process_definition(process, source=self.dirpath)
+            self._processes[process_id] = process
+
+        return process
+
+    def __contains__(self, process_id):
+        """ bool : Checks if a process ID is part of the catalog without loading its definition. """
+        return process_id in self._filepaths
+
+    def __iter__(self):
+        """ iterator : Iterates over all process ID's. """
+        return iter(self._filepaths)
+
+    def __len__(self):
+        """ int : number of processes in the catalog. """
+        return len(self._filepaths)
 
 
 def url_is_valid(url):
@@ -19,17 +184,87 @@ def url_is_valid(url):
 
     """
     try:
-        r = requests.get(url=url)
-        if r.status_code != 200:
-            return False
-        return True
+        with get_session().get(url=url, stream=True) as r:  # the content is not downloaded
+            return r.status_code == 200
     except:
         return False
 
 
+def fetch_remote_json(url):
+    """
+    Downloads a JSON document from a process or collection endpoint (see `remote.fetch_json`).
+
+    Parameters
+    ----------
+    url : str
+        URL of the JSON document.
+
+    Returns
+    -------
+    dict
+
+    """
+    try:
+        return fetch_json(url)
+    except IOError as e:
+        err_msg = "'{}' could not be loaded: {}".format(url, e)
+        raise ValueError(err_msg)
+
+
+def fetch_remote_jsons(urls, max_workers=1, timeout=None):
+    """
+    Downloads several JSON documents concurrently (see `remote.fetch_json`).
+
+    Parameters
+    ----------
+    urls : list of str
+        URLs of the JSON documents.
+    max_workers : int, optional
+        Maximum number of concurrent downloads (default is 1).
+    timeout : float, optional
+        Timeout in seconds for downloading all documents.
+
+    Returns
+    -------
+    list of dict :
+        Downloaded documents in the order of `urls`.
+
+    Notes
+    -----
+    If one or more documents cannot be downloaded within the timeout, a `ValueError` listing every failed URL and
+    its reason is raised.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(fetch_json, url, timeout=timeout) for url in urls]
+        done, _ = wait(futures, timeout=timeout)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    documents = []
+    err_msgs = []
+    for url, future in zip(urls, futures):
+        if future not in done:
+            err_msgs.append("'{}' could not be loaded: timeout of {}s exceeded".format(url, timeout))
+        elif future.exception() is not None:
+            err_msgs.append("'{}' could not be loaded: {}".format(url, future.exception()))
+        else:
+            documents.append(future.result())
+
+    if err_msgs:
+        raise ValueError("\n".join(err_msgs))
+
+    return documents
+
+
 def load_json_file(filepath):
     """
-    Loads json file as dictionary.
+    Loads json file as dictionary with the JSON backend in use (see `jsonio.set_json_backend`).
 
     Parameters
     ----------
@@ -41,11 +276,112 @@ def load_json_file(filepath):
     dict
 
     """
-    with open(filepath) as file:
-        return load(file)
+    return jsonio.load(filepath)
 
 
-def load_processes(src):
+def process_source_key(src):
+    """
+    Creates a hashable key identifying a process definition source and its current state.
+
+    Parameters
+    ----------
+    src : str
+        Directory path to processes (.json), file path to a precompiled process catalog or URL of the remote process
+        endpoint.
+
+    Returns
+    -------
+    tuple :
+        For directories, the absolute path and the latest modification time of the directory and its JSON files.
+        For catalog files, the absolute path and the modification time of the file.
+        For URLs, the URL itself.
+
+    """
+    if os.path.isfile(src):
+        filepath = os.path.abspath(src)
+        return "file", filepath, os.stat(filepath).st_mtime_ns
+    elif os.path.isdir(src):
+        dirpath = os.path.abspath(src)
+        mtime = os.stat(dirpath).st_mtime_ns
+        for entry in os.scandir(dirpath):
+            if entry.name.endswith(".json"):
+                mtime = max(mtime, entry.stat().st_mtime_ns)
+        return "dir", dirpath, mtime
+    else:
+        return "url", src
+
+
+def clear_process_registry():
+    """ Removes all process definitions loaded from a directory or URL from the registry. """
+    PROCESS_REGISTRY.clear()
+
+
+def compile_process_catalog(src, filepath):
+    """
+    Compiles process definitions into a single catalog file, which can be loaded at once by `load_processes`.
+
+    Parameters
+    ----------
+    src : dict or str or list
+        It can be:
+            - dictionary of loaded process definitions (keys are the process ID's)
+            - directory path to processes (.json)
+            - URL of the remote process endpoint (e.g., "https://earthengine.openeo.org/v1.0/processes")
+            - list of loaded process definitions
+    filepath : str
+        Full file path of the catalog file to write.
+
+    Returns
+    -------
+    str :
+        Full file path of the catalog file.
+
+    Notes
+    -----
+    The catalog file starts with a header line containing `CATALOG_HEADER` and `CATALOG_VERSION`, followed by the
+    pickled process definitions. Run this function again to refresh a catalog.
+
+    """
+    processes = load_processes(src)
+    header = CATALOG_HEADER + " {}\n".format(CATALOG_VERSION).encode()
+    with open(filepath, 'wb') as file:
+        file.write(header + pickle.dumps(dict(processes), protocol=pickle.HIGHEST_PROTOCOL))
+
+    return filepath
+
+
+def load_process_catalog(filepath):
+    """
+    Loads process definitions from a catalog file created with `compile_process_catalog`.
+
+    Parameters
+    ----------
+    filepath : str
+        Full file path to the catalog file.
+
+    Returns
+    -------
+    dict :
+        Dictionary linking process IDs with the respective process definitions.
+
+    Notes
+    -----
+    Catalog files are unpickled, so only load catalog files from trusted sources.
+
+    """
+    with open(filepath, 'rb') as file:
+        data = file.read()
+
+    header, _, payload = data.partition(b"\n")
+    expected_header = CATALOG_HEADER + " {}".format(CATALOG_VERSION).encode()
+    if header != expected_header:
+        err_msg = "'{}' is not a process catalog of version {}.".format(filepath, CATALOG_VERSION)
+        raise ValueError(err_msg)
+
+    return pickle.loads(payload)
+
+
+def load_processes(src, lazy=False, runtime=False):
     """
     Collects process definitions from a local process directory, from a URL or a list of process definitions.
 
@@ -55,29 +391,52 @@ def load_processes(src):
             It can be:
                 - dictionary of loaded process definitions (keys are the process ID's)
                 - directory path to processes (.json)
+                - file path to a process catalog (see `compile_process_catalog`)
                 - URL of the remote process endpoint (e.g., "https://earthengine.openeo.org/v1.0/processes")
                 - list of loaded process definitions
+    lazy : bool, optional
+        If true and `src` is a directory path, a `LazyProcessCatalog` is returned, which only parses a process
+        definition file when the process is accessed (default is False).
+    runtime : bool, optional
+        If true and `src` is a directory path, a catalog file path or an URL, the process definitions are loaded as
+        a runtime catalog, i.e. without their documentation (see `trim_process_definition`). The full definitions
+        are only loaded when requested via `RuntimeProcessDefinition.full_definition` (default is False).
 
     Returns
     -------
-    dict :
+    dict or LazyProcessCatalog :
         Dictionary linking process IDs with the respective process definitions.
 
     Notes
     -----
-    When an URL is given, this function downloads the process specifications from the overview endpoint.
+    When an URL is given, this function downloads the process specifications from the overview endpoint
+    (see `remote.fetch_json`).
+    Process definitions loaded from a directory, a catalog file or an URL are stored in a registry
+    (`PROCESS_REGISTRY`), so each source is only loaded once. A directory or catalog file is loaded again if its
+    content was modified.
+    The returned dictionary is shared between all callers and should not be modified.
 
     """
 
-    if isinstance(src, dict):
-        processes = src
+    if isinstance(src, Mapping):
+        return src
+
+    if isinstance(src, str):
+        lazy = lazy and os.path.isdir(src)
+        src_key = (lazy, runtime) + process_source_key(src)
+        if src_key in PROCESS_REGISTRY:
+            return PROCESS_REGISTRY[src_key]
+
+    if isinstance(src, str) and os.path.isfile(src):
+        processes = load_process_catalog(src)
+    elif lazy:
+        processes = LazyProcessCatalog(src, runtime=runtime)
     else:
         if isinstance(src, str) and os.path.isdir(src):
             filepaths = glob.glob(os.path.join(src, "*.json"))
             process_list = [load_json_file(filepath) for filepath in filepaths]
-        elif isinstance(src, str) and url_is_valid(src):
-            r = requests.get(url=src)
-            data = r.json()
+        elif is_url(src):
+            data = fetch_remote_json(src)
             process_list = data['processes']
         elif isinstance(src, list):
             process_list = src
@@ -89,10 +448,20 @@ def load_processes(src):
         for process in process_list:
             processes[process['id']] = process
 
+    if isinstance(src, str) and runtime and not lazy:
+        processes = {process_id: trim_process_definition(process, source=src)
+                     for process_id, process in processes.items()}
+
+    if isinstance(src, str):
+        # drop outdated entries of the same source
+        for key in [key for key in PROCESS_REGISTRY.keys() if key[:4] == src_key[:4]]:
+            del PROCESS_REGISTRY[key]
+        PROCESS_REGISTRY[src_key] = processes
+
     return processes
 
 
-def load_collections(src, collection_ids=None):
+def load_collections(src, collection_ids=None, max_workers=1, timeout=None):
     """
     Collects collection definitions from a local collections directory, from a URL or a list of collection
     definitions.
@@ -107,6 +476,10 @@ def load_collections(src, collection_ids=None):
             - list of loaded collection definitions
     collection_ids : list of str, optional
         List of collection ID's used when an URL is given as a source.
+    max_workers : int, optional
+        Maximum number of collections downloaded concurrently when an URL is given as a source (default is 1).
+    timeout : float, optional
+        Timeout in seconds for downloading all collections when an URL is given as a source.
 
     Returns
     -------
@@ -116,7 +489,8 @@ def load_collections(src, collection_ids=None):
     Notes
     -----
     When an URL is given, this function downloads the collections from each exact collection endpoint.
-    Note that downloading all collections can take quite some time.
+    Note that downloading all collections can take quite some time. Downloaded documents can be cached on disk and
+    revalidated with conditional requests (see `remote.fetch_json`).
 
     """
 
@@ -126,16 +500,12 @@ def load_collections(src, collection_ids=None):
         if isinstance(src, str) and os.path.isdir(src):
             filepaths = glob.glob(os.path.join(src, "*.json"))
             collection_list = [load_json_file(filepath) for filepath in filepaths]
-        elif isinstance(src, str) and url_is_valid(src):
+        elif is_url(src):
             if not collection_ids:
-                r = requests.get(url=src)
-                data = r.json()
+                data = fetch_remote_json(src)
                 collection_ids = [collection['id'] for collection in data['collections']]
-            collection_list = []
-            for collection_id in collection_ids:
-                collection_url = src + "/" + collection_id
-                r = requests.get(url=collection_url)
-                collection_list.append(r.json())
+            collection_urls = [src + "/" + collection_id for collection_id in collection_ids]
+            collection_list = fetch_remote_jsons(collection_urls, max_workers=max_workers, timeout=timeout)
         elif isinstance(src, list):
             collection_list = src
         else:
@@ -1,8 +1,17 @@
 import os
 import warnings
+from openeo_pg_parser.cache import LRUCache
+from openeo_pg_parser.remote import is_url
+from openeo_pg_parser.remote import fetch_json
 from openeo_pg_parser.translate import translate_process_graph
 from openeo_pg_parser.utils import load_processes
 from openeo_pg_parser.utils import load_collections
+from openeo_pg_parser.definitions import OpenEOCollection
+
+
+# collection metadata shared across validations of collections given by a URL or a directory path,
+# replace it by a `LRUCache` with a directory path to store collection metadata on disk
+COLLECTION_CACHE = LRUCache(maxsize=256, ttl=3600)
 
 
 def validate_processes(process_graph, processes_src):
@@ -71,27 +80,19 @@ def validate_collections(process_graph, collections_src):
     for node in process_graph.nodes:
         if node.process_id == 'load_collection':
             collection_id = node.arguments['id']
-            collection_defs = load_collections(collections_src, collection_ids=[collection_id])
-            if node.arguments['id'] not in collection_defs.keys():
+            collection = load_collection(collections_src, collection_id)
+            if collection is None:
                 err_msg = "'{}' is not in the current set of collections.".format(collection_id)
                 err_msgs.append(err_msg)
             else:
-                collection = collection_defs[collection_id]
-                collection_dims = collection['cube:dimensions']
-                available_bands = []
-                for _, collection_dim in collection_dims.items():
-                    if collection_dim['type'] == 'bands':
-                        available_bands.extend([band.lower() for band in collection_dim['values']])
-
                 # check bands
-                if 'bands' in node.arguments.keys() and node.arguments['bands'] and available_bands:
-                    node_bands = [band.lower() for band in node.arguments['bands']]
-                    for node_band in node_bands:
-                        if node_band not in available_bands:
+                if 'bands' in node.arguments.keys() and node.arguments['bands'] and collection.bands:
+                    for node_band in node.arguments['bands']:
+                        if not collection.has_band(node_band):
                             available_bands_str = ', '.join(["'{}'".format(available_band)
-                                                             for available_band in available_bands])
+                                                             for available_band in collection.bands])
                             err_msg = "'{}' is not a valid band name for collection '{}' " \
-                                      "with the following bands: {}.".format(node_band,
+                                      "with the following bands: {}.".format(node_band.lower(),
                                                                              collection_id,
                                                                              available_bands_str)
                             err_msgs.append(err_msg)
@@ -99,7 +100,63 @@ def validate_collections(process_graph, collections_src):
     return err_msgs, len(err_msgs) == 0
 
 
-def validate_process_graph(pg_filepath, collections_src, processes_src=None, parameters=None):
+def load_collection(collections_src, collection_id):
+    """
+    Loads a collection definition. Collections given by a URL or a directory path are cached in `COLLECTION_CACHE`.
+
+    Parameters
+    ----------
+    collections_src : dict or str or list
+        It can be:
+            - dictionary of loaded collection definitions (keys are the collection ID's)
+            - directory path to collections (.json)
+            - URL of the remote collection endpoint (e.g., "https://earthengine.openeo.org/v1.0/collections")
+            - list of loaded collection definitions
+    collection_id : str
+        ID of the collection.
+
+    Returns
+    -------
+    definitions.OpenEOCollection :
+        Collection definition or None if the collection does not exist.
+
+    Notes
+    -----
+    For URLs, only a missing collection (HTTP 404) results in None. All other errors (e.g., timeouts or server
+    errors) are raised, so an unavailable backend does not lead to failing validations.
+
+    """
+    cache_key = None
+    if isinstance(collections_src, str):
+        src_key = os.path.abspath(collections_src) if os.path.isdir(collections_src) else collections_src
+        cache_key = (src_key, collection_id)
+        collection = COLLECTION_CACHE.get(cache_key)
+        if collection is not None:
+            return collection
+
+    if is_url(collections_src):
+        import requests
+
+        try:
+            collection_def = fetch_json(collections_src + "/" + collection_id)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+    else:
+        collection_defs = load_collections(collections_src, collection_ids=[collection_id])
+        if collection_id not in collection_defs.keys():
+            return None
+        collection_def = collection_defs[collection_id]
+
+    collection = OpenEOCollection(collection_def)
+    if cache_key is not None:
+        COLLECTION_CACHE.set(cache_key, collection)
+
+    return collection
+
+
+def validate_process_graph(pg_filepath, collections_src, processes_src=None, parameters=None, use_cache=False):
     """
     Validate the input process graph according to the given list of processes.
 
@@ -122,6 +179,9 @@ def validate_process_graph(pg_filepath, collections_src, processes_src=None, par
         The default value points to the "processes" repository of the parser.
     parameters : dict, optional
         Globally defined parameters, which can be used in 'from_parameter'.
+    use_cache : bool, optional
+        If true, the translated process graph is taken from `translate.TRANSLATION_CACHE` if available
+        (default is False).
 
     Returns
     -------
@@ -133,7 +193,8 @@ def validate_process_graph(pg_filepath, collections_src, processes_src=None, par
     process_defs = os.path.join(os.path.dirname(__file__), "processes") \
         if processes_src is None else processes_src
 
-    process_graph = translate_process_graph(pg_filepath, process_defs=process_defs, parameters=parameters)
+    process_graph = translate_process_graph(pg_filepath, process_defs=process_defs, parameters=parameters,
+                                            use_cache=use_cache)
 
     proc_err_msgs, proc_valid = validate_processes(process_graph, process_defs)
     coll_err_msgs, coll_valid = validate_collections(process_graph, collections_src)
@@ -0,0 +1,42 @@
+import time
+import shutil
+import tempfile
+import unittest
+from openeo_pg_parser.cache import LRUCache
+
+
+class LRUCacheTester(unittest.TestCase):
+    """  Testing the class `LRUCache`. """
+
+    def test_eviction(self):
+        """ Tests that the least recently used entry is evicted. """
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2}
+
+    def test_ttl(self):
+        """ Tests that entries expire after their time-to-live. """
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disk(self):
+        """ Tests that entries stored on disk are shared between cache instances. """
+        dirpath = tempfile.mkdtemp()
+        try:
+            LRUCache(dirpath=dirpath).set(("url", "S2"), {'id': "S2"})
+            assert LRUCache(dirpath=dirpath).get(("url", "S2")) == {'id': "S2"}
+        finally:
+            shutil.rmtree(dirpath)
+
+
+if __name__ == '__main__':
+    unittest.main()
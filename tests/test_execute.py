@@ -0,0 +1,126 @@
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from openeo_pg_parser.translate import translate_process_graph
+from openeo_pg_parser.execute import Executor
+from openeo_pg_parser.execute import ExecutionContext
+from openeo_pg_parser.execute import ProcessExecutionError
+from openeo_pg_parser.execute import ExecutionCancelledError
+
+
+def absolute(x):
+    return abs(x)
+
+
+def add(x, y):
+    return x + y
+
+
+class ExecuteTester(unittest.TestCase):
+    """  Testing the module `execute` for different process graph executions. """
+
+    def setUp(self):
+        """ Setting up variables for one test. """
+        self.pg_dirpath = os.path.join(os.path.dirname(__file__), 'process_graphs')
+        self.max_ndvi_pg_filepath = os.path.join(self.pg_dirpath, "s2_max_ndvi.json")
+        self.process_graph = {"process_graph": {
+            "absolute1": {"process_id": "absolute", "arguments": {"x": -3}},
+            "absolute2": {"process_id": "absolute", "arguments": {"x": -4}},
+            "add": {"process_id": "add", "arguments": {"x": {"from_node": "absolute1"},
+                                                       "y": {"from_node": "absolute2"}}, "result": True}}}
+
+    def test_run(self):
+        """ Tests that nodes run after their dependencies and receive their results in a thread and process pool. """
+        for pool in ["thread", "process"]:
+            executor = Executor({'absolute': absolute, 'add': add}, max_workers=2, pool=pool)
+            execution = executor.run(translate_process_graph(self.process_graph, inplace=False))
+            assert execution['add_2'] == 7
+            assert list(execution.results.keys())[-1] == "add_2"
+            assert set(execution.timings.keys()) == {"absolute1_0", "absolute2_1", "add_2"}
+            assert execution.duration >= 0
+
+    def test_run_callbacks(self):
+        """ Tests that parent processes receive the result of their embedded process graph. """
+        executor = Executor()
+        graph = translate_process_graph(self.max_ndvi_pg_filepath)
+        for process_id in {node.process_id for node in graph.nodes}:
+            executor.register(process_id, lambda process_id=process_id, **arguments: (process_id, arguments))
+
+        execution = executor.run(graph)
+        process_id, arguments = execution['reduce_time_7']
+        assert arguments['reducer'] == execution['max_8']
+        assert arguments['data'] == execution['reduce_bands_3']
+        # callbacks are run once with the data inputs of their parent instead of being invoked by it
+        process_id, arguments = execution['max_8']
+        assert arguments['data'] == execution['reduce_bands_3']
+
+        # references to a parent without data inputs are passed on unresolved
+        process_graph = {"process_graph": {
+            "apply": {"process_id": "apply", "arguments": {"data": [-1, 2], "process": {"process_graph": {
+                "absolute": {"process_id": "absolute", "arguments": {"x": {"from_parameter": "x"}},
+                             "result": True}}}}, "result": True}}}
+        executor.register("absolute", lambda **arguments: ("absolute", arguments))
+        execution = executor.run(translate_process_graph(process_graph))
+        assert execution['absolute_1'] == ("absolute", {'x': {'from_node': 'apply_0'}})
+        assert execution['apply_0'][1]['process'] == execution['absolute_1']
+
+    def test_process_error(self):
+        """ Tests that errors of a process are propagated with the failing node. """
+        executor = Executor({'absolute': absolute})
+
+        @executor.register("add")
+        def failing_add(x, y):
+            raise RuntimeError("add failed")
+
+        with self.assertRaises(ProcessExecutionError) as context:
+            executor.run(translate_process_graph(self.process_graph, inplace=False))
+        assert context.exception.node_id == "add_2"
+        assert isinstance(context.exception.error, RuntimeError)
+
+    def test_missing_process(self):
+        """ Tests that all processes need a registered callable. """
+        with self.assertRaises(ValueError):
+            Executor({'absolute': absolute}).run(translate_process_graph(self.process_graph, inplace=False))
+
+    def test_cancel(self):
+        """ Tests that an execution can be cancelled while processes are running. """
+        executor = Executor({'add': add}, max_workers=1)
+
+        @executor.register("absolute")
+        def cancelling_absolute(x):
+            executor.cancel()
+            time.sleep(0.01)
+            return abs(x)
+
+        with self.assertRaises(ExecutionCancelledError):
+            executor.run(translate_process_graph(self.process_graph, inplace=False))
+
+    def test_cancel_context(self):
+        """ Tests that cancelling affects only running executions or the execution of the given context. """
+        executor = Executor({'absolute': absolute, 'add': add})
+        executor.cancel()
+        assert executor.run(translate_process_graph(self.process_graph, inplace=False))['add_2'] == 7
+
+        context = ExecutionContext()
+        context.cancel()
+        with self.assertRaises(ExecutionCancelledError):
+            executor.run(translate_process_graph(self.process_graph, inplace=False), context=context)
+
+    def test_concurrent_runs(self):
+        """ Tests that several graphs can be run concurrently by the same executor. """
+        executor = Executor({'add': add}, max_workers=2)
+
+        @executor.register("absolute")
+        def slow_absolute(x):
+            time.sleep(0.01)
+            return abs(x)
+
+        graphs = [translate_process_graph(self.process_graph, inplace=False) for _ in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            executions = list(pool.map(executor.run, graphs))
+        assert [execution['add_2'] for execution in executions] == [7] * 4
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import os
 import unittest
+from openeo_pg_parser.graph import Node, Edge, Graph
+from openeo_pg_parser.translate import create_edge
 from openeo_pg_parser.translate import translate_process_graph
 
 
@@ -23,6 +25,44 @@ class GraphTester(unittest.TestCase):
         assert list(sorted_graph.ids) == ["load_collection_2", "red_4", "nir_5", "ndvi_6", "reduce_bands_3", "max_8",
                                           "reduce_time_7",  "linear_scale_range_1", "apply_0", "save_9"]
 
+    def test_sort_cycle(self):
+        """ Tests that cycles are detected and that the cached order is renewed after adding an edge. """
+        nodes = [Node(id=node_id, edges=[]) for node_id in ["a", "b", "c"]]
+        graph = Graph.from_list(nodes)
+        create_edge(nodes[2], nodes[1])
+        assert list(graph.sort(by='dependency').ids) == ["a", "c", "b"]
+
+        # changes of other graphs keep the cached order
+        version = graph.version
+        other_nodes = [Node(id=node_id, edges=[]) for node_id in ["d", "e"]]
+        Graph.from_list(other_nodes).remove_node("e")
+        create_edge(other_nodes[0], other_nodes[1])
+        assert graph.version == version
+
+        create_edge(nodes[1], nodes[2])
+        with self.assertRaises(ValueError):
+            graph.sort(by='dependency')
+
+    def test_plan(self):
+        """ Tests the dependency waves and the ready set of an execution plan. """
+        graph = translate_process_graph(self.max_ndvi_pg_filepath)
+        plan = graph.plan()
+
+        assert [list(wave.ids) for wave in plan.waves[:3]] == [["load_collection_2"], ["red_4", "nir_5"], ["ndvi_6"]]
+        assert plan.widths == [1, 2, 1, 1, 1, 1, 1, 1, 1]
+        assert plan.max_width == 2
+        assert plan.stats['n_waves'] == 9
+
+        with self.assertRaises(ValueError):
+            plan.done("save_9")
+        node_ids = []
+        while plan.is_active():
+            ready_ids = [node.id for node in plan.get_ready()]
+            assert ready_ids
+            node_ids.extend(ready_ids)
+            plan.done(*ready_ids)
+        assert node_ids == list(graph.sort(by='dependency').ids)
+
     def test_get_parent_process(self):
         """ Tests to retrieve the parent process of an embedded process graph. """
         graph = translate_process_graph(self.max_ndvi_pg_filepath)
@@ -51,5 +91,64 @@ class GraphTester(unittest.TestCase):
         reduce_node = graph['reduce_time_7']
         assert reduce_node.dimension == 't'
 
+    def test_shared_processes(self):
+        """ Tests that nodes of the same process share one immutable process instance. """
+        graph = translate_process_graph(self.max_ndvi_pg_filepath)
+
+        red_node = graph['red_4']
+        nir_node = graph['nir_5']
+        assert red_node.process is nir_node.process
+        assert red_node.process.parameters is nir_node.process.parameters
+        with self.assertRaises(AttributeError):
+            red_node.process.definition = {}
+
+    def test_indexed_relatives(self):
+        """ Tests that the relatives of a node per link name are kept up to date when removing edges. """
+        graph = translate_process_graph(self.max_ndvi_pg_filepath)
+
+        ndvi_node = graph['ndvi_6']
+        assert set(ndvi_node.ancestors("data").ids) == {"red_4", "nir_5"}
+        assert list(ndvi_node.descendants("callback").ids) == ["reduce_bands_3"]
+        assert set(graph['reduce_bands_3'].child_processes.ids) == {"red_4", "nir_5", "ndvi_6"}
+        assert len(ndvi_node.ancestors("unknown")) == 0
+        ndvi_node.ancestors("data").add_node(graph['load_collection_2'])
+        assert set(ndvi_node.ancestors("data").ids) == {"red_4", "nir_5"}
+
+        edge = [edge for edge in ndvi_node.edges if edge.node_ids == ["red_4", "ndvi_6"]][0]
+        ndvi_node.remove_edge(edge)
+        graph['red_4'].remove_edge(edge)
+        assert list(ndvi_node.dependencies.ids) == ["nir_5"]
+        assert list(graph['red_4'].descendants("data").ids) == []
+
+    def test_copy(self):
+        """ Tests that copies have their own nodes and edges and share the contents only if requested. """
+        graph = translate_process_graph(self.max_ndvi_pg_filepath)
+        for copy_contents in [True, False]:
+            graph_copy = graph.copy(copy_contents=copy_contents)
+            assert list(graph_copy.ids) == list(graph.ids)
+            assert (graph_copy['save_9'].content is graph['save_9'].content) is not copy_contents
+            assert graph_copy['ndvi_6'].ancestors("data")['red_4'] is graph_copy['red_4']
+            assert {edge.key for edge in graph_copy.edges} == {edge.key for edge in graph.edges}
+            assert all(edge_node is graph_copy[edge_node.id] for edge in graph_copy.edges for edge_node in edge.nodes)
+
+    def test_edge_identity(self):
+        """ Tests that edges are identified by their nodes and name and are registered once per node. """
+        n_branches = 200
+        arguments = {"id": "S2", "spatial_extent": None, "temporal_extent": None}
+        process_graph = {"load": {"process_id": "load_collection", "arguments": arguments}}
+        for i in range(n_branches):
+            process_graph["absolute{}".format(i)] = {"process_id": "absolute",
+                                                     "arguments": {"x": {"from_node": "load"}}}
+        graph = translate_process_graph({"process_graph": process_graph})
+
+        load_node = graph['load_0']
+        assert len(load_node.edges) == n_branches
+        assert len(graph.edges) == n_branches
+        edge = next(iter(load_node.edges))
+        edge_copy = Edge(name=edge.name, nodes=list(edge.nodes))
+        assert edge_copy == edge and hash(edge_copy) == hash(edge)
+        load_node.add_edge(edge_copy)
+        assert len(load_node.edges) == n_branches
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
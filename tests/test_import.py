@@ -0,0 +1,42 @@
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+
+IMPORT_SCRIPT = """
+import sys
+import json
+import time
+start = time.perf_counter()
+import openeo_pg_parser.validate
+duration = time.perf_counter() - start
+print(json.dumps({'duration': duration, 'modules': sorted(sys.modules.keys())}))
+"""
+
+
+class ImportTester(unittest.TestCase):
+    """  Guards the import time of the package against slow dependencies. """
+
+    def setUp(self):
+        """ Imports the package in a fresh interpreter. """
+        env = dict(os.environ)
+        src_dirpath = os.path.join(os.path.dirname(__file__), "..", "src")
+        env['PYTHONPATH'] = os.pathsep.join([src_dirpath, env.get('PYTHONPATH', "")])
+        output = subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT], env=env)
+        self.result = json.loads(output.decode().splitlines()[-1])
+
+    def test_no_heavy_imports(self):
+        """ Tests that slow modules are only imported when they are needed. """
+        heavy_modules = ["numpy", "pkg_resources", "requests", "pprint"]
+        for module in heavy_modules:
+            assert module not in self.result['modules'], "'{}' is imported at startup".format(module)
+
+    def test_import_time(self):
+        """ Tests that importing the package stays fast. """
+        assert self.result['duration'] < 0.5
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from openeo_pg_parser import jsonio
+
+
+class JSONIOTester(unittest.TestCase):
+    """  Testing the module `jsonio` with all installed JSON backends. """
+
+    def setUp(self):
+        """ Remembers the JSON backend in use. """
+        self.backend = jsonio.get_json_backend()
+
+    def tearDown(self):
+        """ Restores the JSON backend in use. """
+        jsonio.set_json_backend(self.backend)
+
+    def test_backends(self):
+        """ Tests loading and serializing JSON documents from different inputs with all installed backends. """
+        document = '{"b": [1, 2.5, null], "a": {"text": "\\u00e9"}}'
+        obj = {'b': [1, 2.5, None], 'a': {'text': "é"}}
+        for backend in jsonio.BACKENDS:
+            try:
+                jsonio.set_json_backend(backend)
+            except ValueError:  # backend not installed
+                continue
+
+            for data in [document, document.encode("utf-8"), memoryview(document.encode("utf-8"))]:
+                assert jsonio.loads(data) == obj
+            assert jsonio.dumps(obj, sort_keys=True) == '{"a":{"text":"é"},"b":[1,2.5,null]}'.encode("utf-8")
+            assert jsonio.dumps({'a': {1, 2}}, default=sorted) == b'{"a":[1,2]}'
+
+    def test_unknown_backend(self):
+        """ Tests that unknown backends raise an error. """
+        with self.assertRaises(ValueError):
+            jsonio.set_json_backend("yaml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import pickle
+import unittest
+from openeo_pg_parser import lazyjson
+
+
+class LazyJSONTester(unittest.TestCase):
+    """  Testing the module `lazyjson`. """
+
+    def setUp(self):
+        """ Setting up a JSON document with a large literal and references. """
+        self.coordinates = [[[i * 0.5, -i * 0.25] for i in range(2000)]]
+        self.data = {"process_graph": {
+            "load": {"process_id": "load_collection",
+                     "arguments": {"id": "S2", "spatial_extent": {"type": "Polygon",
+                                                                  "coordinates": self.coordinates},
+                                   "udf": "print(\"[{\")" * 1000}},
+            "apply": {"process_id": "apply",
+                      "arguments": {"data": {"from_node": "load"},
+                                    "labels": ["a", "b"] * 1000},
+                      "result": True}}}
+        self.document = json.dumps(self.data)
+
+    def test_loads(self):
+        """ Tests that only large literals without references are kept as raw text. """
+        data = lazyjson.loads(self.document)
+
+        spatial_extent = data['process_graph']['load']['arguments']['spatial_extent']
+        assert isinstance(spatial_extent, lazyjson.RawJSON)
+        assert spatial_extent.value == self.data['process_graph']['load']['arguments']['spatial_extent']
+        assert isinstance(data['process_graph']['apply']['arguments']['labels'], lazyjson.RawJSON)
+        assert data['process_graph']['apply']['arguments']['data'] == {"from_node": "load"}
+        assert json.loads(json.dumps(data, default=lambda obj: obj.value)) == self.data
+
+    def test_loads_bytes(self):
+        """ Tests parsing of bytes without raw literals. """
+        assert lazyjson.loads(self.document.encode("utf-8"), min_raw_size=10**9) == self.data
+
+    def test_pickle(self):
+        """ Tests that only the raw text of a literal is kept and pickled, not the whole document. """
+        spatial_extent = lazyjson.loads(self.document)['process_graph']['load']['arguments']['spatial_extent']
+        raw = json.dumps(self.data['process_graph']['load']['arguments']['spatial_extent']).encode("utf-8")
+        assert spatial_extent.raw == raw
+        spatial_extent_pickled = pickle.loads(pickle.dumps(spatial_extent))
+        assert spatial_extent_pickled.raw == raw
+        assert spatial_extent_pickled == spatial_extent
+
+    def test_resolve(self):
+        """ Tests that all raw literals are replaced by their parsed values. """
+        data = lazyjson.resolve(lazyjson.loads(self.document))
+        assert data == self.data
+        assert isinstance(data['process_graph']['load']['arguments']['spatial_extent'], dict)
+
+
+if __name__ == '__main__':
+    unittest.main()
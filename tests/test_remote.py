@@ -0,0 +1,115 @@
+import json
+import shutil
+import tempfile
+import unittest
+import threading
+from http.server import HTTPServer
+from http.server import BaseHTTPRequestHandler
+from openeo_pg_parser.remote import fetch_json
+from openeo_pg_parser.utils import load_processes
+from openeo_pg_parser.utils import load_collections
+from openeo_pg_parser.validate import load_collection
+
+
+DOCUMENTS = {
+    "/processes": {"processes": [{"id": "absolute", "parameters": [], "returns": {}}]},
+    "/collections": {"collections": [{"id": "S2"}, {"id": "S1"}]},
+    "/collections/S2": {"id": "S2", "cube:dimensions": {}},
+    "/collections/S1": {"id": "S1", "cube:dimensions": {}},
+}
+
+# paths answered with a server error
+ERRORS = {"/collections/S5": 503}
+
+
+class BackendHandler(BaseHTTPRequestHandler):
+    """ Minimal openEO backend serving static JSON documents with ETags. """
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path not in DOCUMENTS:
+            self.send_response(ERRORS.get(self.path, 404))
+            self.end_headers()
+            return
+
+        etag = '"{}"'.format(self.path)
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        content = json.dumps(DOCUMENTS[self.path]).encode("utf-8")
+        self.send_response(200)
+        self.send_header('Content-Type', "application/json")
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class RemoteTester(unittest.TestCase):
+    """  Testing the module `remote` against a local HTTP server. """
+
+    def setUp(self):
+        """ Starts a local HTTP server and creates a cache directory. """
+        self.server = HTTPServer(("127.0.0.1", 0), BackendHandler)
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_port)
+        self.cache_dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Stops the HTTP server and removes the cache directory. """
+        self.stop_server()
+        shutil.rmtree(self.cache_dirpath)
+
+    def stop_server(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def test_conditional_fetch(self):
+        """ Tests revalidation of cached documents and offline usage of the cache. """
+        url = self.url + "/collections/S2"
+        data = fetch_json(url, cache_dirpath=self.cache_dirpath)
+        assert data == DOCUMENTS["/collections/S2"]
+        assert fetch_json(url, cache_dirpath=self.cache_dirpath) == data
+        assert self.server.requests == ["/collections/S2", "/collections/S2"]
+
+        self.stop_server()
+        assert fetch_json(url, cache_dirpath=self.cache_dirpath) == data
+
+    def test_load_from_url(self):
+        """ Tests that processes and collections are loaded with one request per document. """
+        processes = load_processes(self.url + "/processes")
+        assert list(processes.keys()) == ["absolute"]
+
+        collections = load_collections(self.url + "/collections")
+        assert sorted(collections.keys()) == ["S1", "S2"]
+        assert sorted(self.server.requests) == ["/collections", "/collections/S1", "/collections/S2", "/processes"]
+
+    def test_concurrent_collections(self):
+        """ Tests concurrent download of collections. """
+        collections = load_collections(self.url + "/collections", max_workers=4, timeout=10)
+        assert list(collections.keys()) == ["S2", "S1"]
+
+    def test_missing_document(self):
+        """ Tests that missing documents raise an error. """
+        with self.assertRaises(ValueError):
+            load_collections(self.url + "/collections", collection_ids=["S1", "S3", "S4"], max_workers=2)
+
+    def test_load_collection(self):
+        """ Tests that only missing collections are reported as not available, while server errors are raised. """
+        assert load_collection(self.url + "/collections", "S2").id == "S2"
+        assert load_collection(self.url + "/collections", "S3") is None
+        with self.assertRaises(IOError):
+            load_collection(self.url + "/collections", "S5")
+
+
+if __name__ == '__main__':
+    unittest.main()
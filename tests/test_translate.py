@@ -1,6 +1,22 @@
 import os
+import sys
+import copy
+import json
 import unittest
+import openeo_pg_parser
+from collections import OrderedDict
+from concurrent.futures import Future
+from openeo_pg_parser.lazyjson import RawJSON
 from openeo_pg_parser.translate import translate_process_graph
+from openeo_pg_parser.translate import translate_process_graphs
+from openeo_pg_parser.translate import get_translation
+from openeo_pg_parser.translate import TRANSLATION_CACHE
+from openeo_pg_parser.translate import ProcessGraphEditor
+from openeo_pg_parser.translate import compile_process_graph
+from openeo_pg_parser.translate import walk_process_graph
+from openeo_pg_parser.translate import build_scopes
+from openeo_pg_parser.translate import build_parameter_table
+from openeo_pg_parser.utils import load_processes
 
 
 class TranslateTester(unittest.TestCase):
@@ -11,6 +27,7 @@ class TranslateTester(unittest.TestCase):
         self.pg_dirpath = os.path.join(os.path.dirname(__file__), 'process_graphs')
         self.uc1_polarization_pg_filepath = os.path.join(self.pg_dirpath, "s1_uc1_polarization.json")
         self.non_existing_filepath = os.path.join(self.pg_dirpath, "does_not_exist.json")
+        self.processes_dirpath = os.path.join(os.path.dirname(openeo_pg_parser.__file__), "processes")
 
     def test_translate_process_graph(self):
         """ Translates a process graph from openEO syntax to a Python traversable object. """
@@ -42,6 +59,277 @@ class TranslateTester(unittest.TestCase):
 
         assert graph['ndvi_6'].arguments['y'] == 3
 
+    def test_compile_process_graph(self):
+        """ Tests binding a compiled process graph to different global parameters. """
+        global_parameter_filepath = os.path.join(self.pg_dirpath, "s2_max_ndvi_global_parameter.json")
+        compiled_graph = compile_process_graph(global_parameter_filepath)
+        assert compiled_graph.parameter_names == {'test_from_parameter'}
+
+        graph = compiled_graph.bind({'test_from_parameter': 3})
+        assert graph['ndvi_6'].arguments['y'] == 3
+        graph_copy = compiled_graph.bind({'test_from_parameter': 5}, copy=True)
+        assert graph_copy['ndvi_6'].arguments['y'] == 5
+        assert graph['ndvi_6'].arguments['y'] == 3
+        assert [node.content for node in graph.nodes] == \
+            [node.content for node in translate_process_graph(global_parameter_filepath,
+                                                              parameters={'test_from_parameter': 3}).nodes]
+
+        with self.assertRaises(ValueError):
+            compiled_graph.bind({})
+
+    def test_walk_deeply_nested_process_graph(self):
+        """ Tests that walking a process graph does not depend on the recursion limit. """
+        depth = sys.getrecursionlimit() + 100
+        process_graph = {"absolute": {"process_id": "absolute", "arguments": {"x": 1}, "result": True}}
+        for _ in range(depth):
+            process_graph = {"apply": {"process_id": "apply",
+                                       "arguments": {"process": {"process_graph": process_graph}},
+                                       "result": True}}
+
+        nodes = walk_process_graph(process_graph, OrderedDict(), self.processes_dirpath)
+        assert len(nodes) == depth + 1
+        assert nodes["absolute_{}".format(depth)].depth == depth
+        assert nodes["absolute_{}".format(depth)].keys[-1] == "absolute"
+
+    def test_scopes(self):
+        """ Tests the name index of each process graph. """
+        graph = translate_process_graph(os.path.join(self.pg_dirpath, "s2_max_ndvi.json"))
+        scopes = build_scopes(graph)
+
+        assert list(scopes[None].keys()) == ["apply", "load_collection", "reduce_bands", "reduce_time", "save"]
+        assert list(scopes[("reduce_bands_3", ("reducer",))].keys()) == ["red", "nir", "ndvi"]
+        assert scopes[("reduce_bands_3", ("reducer",))]["ndvi"] is graph["ndvi_6"]
+
+    def test_parameter_table(self):
+        """ Tests the parameters available in an embedded process graph. """
+        local_parameter_filepath = os.path.join(self.pg_dirpath, "s2_max_ndvi_local_parameter.json")
+        graph = translate_process_graph(local_parameter_filepath)
+        parameter_table = build_parameter_table(graph['reduce_bands_3'])
+
+        is_sub_parameter, parameter = parameter_table['data']
+        assert is_sub_parameter and parameter.is_required
+        is_sub_parameter, parameter = parameter_table['dimension']
+        assert not is_sub_parameter
+
+    def test_references(self):
+        """ Tests the references recorded while walking through a process graph. """
+        graph = translate_process_graph(os.path.join(self.pg_dirpath, "s2_max_ndvi.json"))
+
+        assert graph['reduce_bands_3'].references == {'from_node': [("data", "from_node")],
+                                                      'from_parameter': [],
+                                                      'process_graph': [("reducer",)]}
+        assert graph['ndvi_6'].references['from_node'] == [("x", "from_node"), ("y", "from_node")]
+        assert graph['red_4'].references['from_parameter'] == [("data", "from_parameter")]
+
+    def test_translate_not_inplace(self):
+        """ Tests that the given process graph dictionary is not modified. """
+        with open(os.path.join(self.pg_dirpath, "s2_max_ndvi.json")) as file:
+            process_graph = json.load(file)
+        process_graph_orig = copy.deepcopy(process_graph)
+
+        graph = translate_process_graph(process_graph, inplace=False)
+        assert process_graph == process_graph_orig
+        # literal arguments are shared
+        assert graph['load_collection_2'].content['arguments']['spatial_extent'] is \
+            process_graph['process_graph']['load_collection']['arguments']['spatial_extent']
+
+        graph_inplace = translate_process_graph(process_graph_orig)
+        assert [node.content for node in graph.nodes] == [node.content for node in graph_inplace.nodes]
+
+    def test_translate_stream(self):
+        """ Tests translating a process graph document while keeping large literals unparsed. """
+        with open(os.path.join(self.pg_dirpath, "s2_max_ndvi.json"), 'rb') as file:
+            document = file.read()
+
+        graph = translate_process_graph(document, stream=True, min_raw_size=100)
+        spatial_extent = graph['load_collection_2'].content['arguments']['spatial_extent']
+        assert isinstance(spatial_extent, RawJSON)
+        assert graph['load_collection_2'].arguments['spatial_extent']['type'] == spatial_extent.value['type']
+        assert [node.content for node in graph.nodes] == \
+            [node.content for node in translate_process_graph(json.loads(document)).nodes]
+
+        # parameter definitions are always parsed, even if they are large
+        description = "Parameter " * 500
+        process_graph = json.loads(document)
+        process_graph['parameters'] = [{"name": "bands", "description": description, "schema": {"type": "array"},
+                                        "default": ["B4", "B8"]}]
+        arguments = process_graph['process_graph']['reduce_bands']['arguments']
+        arguments['reducer']['parameters'] = [{"name": "nodata", "description": description, "schema": {},
+                                               "default": True}]
+        arguments['reducer']['process_graph']['red']['arguments']['return_nodata'] = {"from_parameter": "nodata"}
+        arguments['bands'] = {"from_parameter": "bands"}
+        graph = translate_process_graph(json.dumps(process_graph).encode("utf-8"), stream=True, min_raw_size=100)
+        assert graph['reduce_bands_3'].content['arguments']['bands'] == ["B4", "B8"]
+        assert graph['red_4'].content['arguments']['return_nodata'] is True
+
+    def test_translate_process_graphs(self):
+        """ Tests batch translation in a process pool, including errors of single process graphs. """
+        pg_filepaths = [os.path.join(self.pg_dirpath, "s2_max_ndvi.json"), self.non_existing_filepath,
+                        self.uc1_polarization_pg_filepath] * 3
+
+        results = list(translate_process_graphs(pg_filepaths, max_workers=2))
+        assert [index for index, _, _ in results] == list(range(len(pg_filepaths)))
+        for index, graph, error in results:
+            if pg_filepaths[index] == self.non_existing_filepath:
+                assert graph is None and isinstance(error, FileNotFoundError)
+            else:
+                assert error is None
+                assert list(graph.ids) == list(translate_process_graph(pg_filepaths[index]).ids)
+
+        results = list(translate_process_graphs(iter(pg_filepaths), max_workers=2, ordered=False))
+        assert sorted(index for index, _, _ in results) == list(range(len(pg_filepaths)))
+
+        # long chains of nodes can be returned from the workers
+        process_graph = {"absolute0": {"process_id": "absolute", "arguments": {"x": -1}}}
+        for i in range(1, 500):
+            process_graph["absolute{}".format(i)] = {"process_id": "absolute",
+                                                     "arguments": {"x": {"from_node": "absolute{}".format(i - 1)}}}
+        results = list(translate_process_graphs([{"process_graph": process_graph}] * 2, max_workers=2))
+        assert [error for _, _, error in results] == [None, None]
+        assert len(results[0][1]) == 500
+        assert list(results[0][1]['absolute499_499'].dependencies.ids) == ["absolute498_498"]
+
+        # errors of returning a translation are reported for the respective process graph
+        future = Future()
+        future.set_exception(RecursionError("maximum recursion depth exceeded"))
+        index, graph, error = get_translation(3, future)
+        assert index == 3 and graph is None and isinstance(error, RecursionError)
+
+        # interleaved batches translated in the calling process keep their own process definitions
+        pg_filepaths = [os.path.join(self.pg_dirpath, "s2_max_ndvi.json")] * 2
+        results = translate_process_graphs(pg_filepaths, max_workers=1)
+        results_empty = translate_process_graphs(pg_filepaths, process_defs={}, max_workers=1)
+        for _ in pg_filepaths:
+            assert isinstance(next(results_empty)[2], ValueError)
+            assert next(results)[2] is None
+
+    def test_translation_cache(self):
+        """ Tests that identical translations are taken from the cache and returned as independent copies. """
+        TRANSLATION_CACHE.clear()
+        with open(os.path.join(self.pg_dirpath, "s2_max_ndvi.json")) as file:
+            process_graph = json.load(file)
+        process_graph_copy = copy.deepcopy(process_graph)
+
+        # the given dictionary is neither modified on a cache miss nor on a hit
+        graph = translate_process_graph(process_graph, use_cache=True)
+        graph_cached = translate_process_graph(process_graph, use_cache=True)
+        assert process_graph == process_graph_copy
+        assert TRANSLATION_CACHE.stats['hits'] == 1 and TRANSLATION_CACHE.stats['misses'] == 1
+        assert list(graph_cached.ids) == list(graph.ids)
+        assert [node.content for node in graph_cached.nodes] == [node.content for node in graph.nodes]
+        assert graph_cached['save_9'].content is not graph['save_9'].content
+        assert graph_cached['max_8'].parent_process is graph_cached['reduce_time_7']
+        # references can be changed in the returned copy without changing the cached graph
+        graph_cached['reduce_time_7'].content['arguments']['data']['from_node'] = "max_8"
+        graph_cached = translate_process_graph(process_graph, use_cache=True)
+        assert graph_cached['reduce_time_7'].content['arguments']['data'] == {"from_node": "reduce_bands_3"}
+
+        # node ID's depend on the key order, so a reordered process graph is translated again
+        process_graph_reordered = json.loads(json.dumps(process_graph, sort_keys=True))
+        graph_reordered = translate_process_graph(process_graph_reordered, use_cache=True)
+        assert TRANSLATION_CACHE.stats['misses'] == 2
+        assert list(graph_reordered.ids) == list(translate_process_graph(process_graph_reordered, inplace=False).ids)
+
+        translate_process_graph(process_graph, parameters={'a': 1}, use_cache=True)
+        assert TRANSLATION_CACHE.stats['misses'] == 3
+
+        # loaded process definitions are identified by their content
+        process_defs = load_processes(os.path.join(os.path.dirname(openeo_pg_parser.__file__), "processes"))
+        translate_process_graph(process_graph, process_defs=process_defs, use_cache=True)
+        translate_process_graph(process_graph, process_defs=copy.deepcopy(process_defs), use_cache=True)
+        assert TRANSLATION_CACHE.stats['misses'] == 4 and TRANSLATION_CACHE.stats['hits'] == 3
+        process_defs = copy.deepcopy(process_defs)
+        process_defs['max']['summary'] = "Maximum"
+        translate_process_graph(process_graph, process_defs=process_defs, use_cache=True)
+        assert TRANSLATION_CACHE.stats['misses'] == 5
+        TRANSLATION_CACHE.clear()
+
+    def test_sibling_callbacks(self):
+        """ Tests that each embedded process graph of a node has its own scope, even if node names are repeated. """
+        properties = {
+            "eo:cloud_cover": {"process_graph": {"c": {"process_id": "between", "arguments": {
+                "x": {"from_parameter": "value"}, "min": 0, "max": 50}, "result": True}}},
+            "platform": {"process_graph": {"c": {"process_id": "eq", "arguments": {
+                "x": {"from_parameter": "value"}, "y": "Sentinel-2B"}, "result": True}}}}
+        process_graph = {"process_graph": {"load": {"process_id": "load_collection", "arguments": {
+            "id": "S2", "spatial_extent": None, "temporal_extent": None, "properties": properties}, "result": True}}}
+        graph = translate_process_graph(copy.deepcopy(process_graph))
+
+        assert graph['load_0'].content['arguments']['properties'] == {"eo:cloud_cover": {"from_node": "c_1"},
+                                                                      "platform": {"from_node": "c_2"}}
+        scopes = build_scopes(graph)
+        assert scopes[("load_0", ("properties", "eo:cloud_cover"))]["c"] is graph["c_1"]
+        assert scopes[("load_0", ("properties", "platform"))]["c"] is graph["c_2"]
+
+        editor = ProcessGraphEditor(graph)
+        content = {"process_id": "eq", "arguments": {"x": {"from_parameter": "value"}, "y": "S2"}}
+        with self.assertRaises(ValueError):
+            editor.insert_node("d", copy.deepcopy(content), parent_id="load_0")
+        editor.insert_node("d", copy.deepcopy(content), parent_id="load_0", pg_keys=("properties", "platform"))
+        properties["platform"]["process_graph"]["d"] = content
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+
+    def test_process_graph_editor(self):
+        """ Tests that incremental edits give the same graph as translating the edited process graph. """
+        with open(os.path.join(self.pg_dirpath, "s2_max_ndvi.json")) as file:
+            process_graph = json.load(file)
+        graph = translate_process_graph(copy.deepcopy(process_graph))
+        editor = ProcessGraphEditor(graph)
+
+        content = {"process_id": "absolute", "arguments": {"x": {"from_node": "reduce_time"}}}
+        node = editor.insert_node("absolute", copy.deepcopy(content))
+        process_graph['process_graph']['absolute'] = content
+        assert node.id == "absolute_10"
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+
+        arguments = process_graph['process_graph']['reduce_time']['arguments']
+        arguments['reducer']['process_graph'] = {
+            "min": {"process_id": "min", "arguments": {"data": {"from_parameter": "data"}}, "result": True}}
+        editor.update_node_arguments("reduce_time_7", copy.deepcopy(arguments))
+        assert "max_8" not in graph.ids
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+
+        content = {"process_id": "multiply", "arguments": {"x": {"from_node": "red"}, "y": 2}}
+        editor.insert_node("multiply", copy.deepcopy(content), parent_id="reduce_bands_3")
+        process_graph['process_graph']['reduce_bands']['arguments']['reducer']['process_graph']['multiply'] = content
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+
+        with self.assertRaises(ValueError):
+            editor.remove_node("reduce_time_7")
+        editor.remove_node("absolute_10")
+        del process_graph['process_graph']['absolute']
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+
+        # nodes can be inserted into an empty embedded process graph
+        arguments['reducer']['process_graph'] = {}
+        editor.update_node_arguments("reduce_time_7", copy.deepcopy(arguments))
+        content = {"process_id": "min", "arguments": {"data": {"from_parameter": "data"}}, "result": True}
+        node = editor.insert_node("min", copy.deepcopy(content), parent_id="reduce_time_7")
+        arguments['reducer']['process_graph']['min'] = content
+        assert node.keys == ("reduce_time", "arguments", "reducer", "process_graph", "min")
+        assert canonical_graph(graph) == canonical_graph(translate_process_graph(copy.deepcopy(process_graph)))
+        with self.assertRaises(ValueError):
+            editor.insert_node("max", copy.deepcopy(content), parent_id="save_9")
+
+
+def canonical_graph(graph):
+    """ Replaces all node IDs of a graph by the keys pointing to the nodes for comparing graphs. """
+    paths = {node.id: "/".join(str(key) for key in node.keys) for node in graph.nodes}
+
+    def replace_ids(obj):
+        if isinstance(obj, dict):
+            return {key: paths.get(value, value) if key == "from_node" else replace_ids(value)
+                    for key, value in obj.items()}
+        elif isinstance(obj, list):
+            return [replace_ids(value) for value in obj]
+        return obj
+
+    nodes = {paths[node.id]: (replace_ids(node.content), node.depth, node.keys) for node in graph.nodes}
+    edges = {(paths[edge.nodes[0].id], paths[edge.nodes[1].id], edge.name, edge.hidden)
+             for node in graph.nodes for edge in node.edges}
+
+    return nodes, edges
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
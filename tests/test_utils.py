@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+import unittest
+import openeo_pg_parser
+from openeo_pg_parser.translate import translate_process_graph
+from openeo_pg_parser.definitions import OpenEOProcess
+from openeo_pg_parser.utils import load_processes
+from openeo_pg_parser.utils import clear_process_registry
+from openeo_pg_parser.utils import compile_process_catalog
+
+
+class UtilsTester(unittest.TestCase):
+    """  Testing the module `utils`. """
+
+    def setUp(self):
+        """ Setting up variables for one test. """
+        self.processes_dirpath = os.path.join(os.path.dirname(openeo_pg_parser.__file__), "processes")
+
+    def test_load_processes_registry(self):
+        """ Tests if process definitions from a directory are only loaded once. """
+        clear_process_registry()
+        processes = load_processes(self.processes_dirpath)
+        assert 'load_collection' in processes.keys()
+        assert load_processes(self.processes_dirpath) is processes
+
+    def test_process_catalog(self):
+        """ Tests compiling and loading a process catalog file. """
+        tmp_dirpath = tempfile.mkdtemp()
+        try:
+            catalog_filepath = os.path.join(tmp_dirpath, "processes.catalog")
+            compile_process_catalog(self.processes_dirpath, catalog_filepath)
+            processes = load_processes(catalog_filepath)
+            assert processes == load_processes(self.processes_dirpath)
+
+            invalid_filepath = os.path.join(tmp_dirpath, "invalid.catalog")
+            with open(invalid_filepath, 'wb') as file:
+                file.write(b"no catalog")
+            with self.assertRaises(ValueError):
+                load_processes(invalid_filepath)
+        finally:
+            shutil.rmtree(tmp_dirpath)
+
+    def test_lazy_process_catalog(self):
+        """ Tests that a lazy process catalog only loads the processes used in a process graph. """
+        processes = load_processes(self.processes_dirpath, lazy=True)
+        assert 'ndvi' in processes
+        assert processes.loaded_ids == []
+
+        pg_filepath = os.path.join(os.path.dirname(__file__), 'process_graphs', "s2_max_ndvi.json")
+        translate_process_graph(pg_filepath, process_defs=processes)
+        assert sorted(processes.loaded_ids) == ["apply", "array_element", "linear_scale_range", "load_collection",
+                                                "max", "normalized_difference", "reduce_dimension",
+                                                "save_result"]
+        assert processes['ndvi'] == load_processes(self.processes_dirpath)['ndvi']
+
+    def test_runtime_catalog(self):
+        """ Tests that a runtime catalog drops the documentation, but can still provide it. """
+        processes = load_processes(self.processes_dirpath, runtime=True)
+        full_processes = load_processes(self.processes_dirpath)
+        assert 'description' not in processes['ndvi'].keys()
+        assert 'description' not in processes['ndvi']['parameters'][0].keys()
+
+        process = OpenEOProcess.from_definition(processes['ndvi'])
+        assert list(process.parameters.keys()) == [parameter['name']
+                                                   for parameter in full_processes['ndvi']['parameters']]
+        assert process.description == full_processes['ndvi']['description']
+
+        pg_filepath = os.path.join(os.path.dirname(__file__), 'process_graphs', "s2_max_ndvi_local_parameter.json")
+        graph = translate_process_graph(pg_filepath, process_defs=load_processes(self.processes_dirpath, lazy=True,
+                                                                                 runtime=True))
+        assert graph['ndvi_6'].arguments['y'] == 3
+
+
+if __name__ == '__main__':
+    unittest.main()
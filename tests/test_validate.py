@@ -11,6 +11,8 @@ class ValidateTester(unittest.TestCase):
         pg_dirpath = os.path.join(os.path.dirname(__file__), 'process_graphs')
         self.wrong_band_filepath = os.path.join(pg_dirpath, "test_s2_wrong_band.json")
         self.max_ndvi_pg_filepath = os.path.join(pg_dirpath, "s2_max_ndvi.json")
+        self.collections = [{'id': "COPERNICUS/S2",
+                             'cube:dimensions': {'bands': {'type': "bands", 'values': ["B4", "B8"]}}}]
 
     def test_validate_process_graph_local(self):
         """ Validate a process graph using processes defined on a backend. """
@@ -35,6 +37,16 @@ class ValidateTester(unittest.TestCase):
 
         assert not valid
 
+    def test_validate_collections_local(self):
+        """ Validate band names of a process graph using local collection definitions. """
+        _, valid = validate_process_graph(self.max_ndvi_pg_filepath, self.collections)
+        assert valid
+
+        err_msgs, valid = validate_process_graph(self.wrong_band_filepath, self.collections)
+        assert not valid
+        assert err_msgs == ["'b200' is not a valid band name for collection 'COPERNICUS/S2' "
+                            "with the following bands: 'b4', 'b8'."]
+
 
 if __name__ == '__main__':
     unittest.main()